@@ -1,33 +1,44 @@
 import os
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+# 서버 실행 방식 - sync: 요청마다 스레드 / async: gevent 이벤트 루프 (MongoDB 등 I/O 대기 중 다른 요청 처리)
+SERVER_MODE = os.getenv('SERVER_MODE', 'sync')
+if SERVER_MODE == 'async':
+    # 소켓을 사용하는 모듈(pymongo 등)을 불러오기 전에 패치해야 함
+    from gevent import monkey
+    monkey.patch_all()
+
 import cv2
 import numpy as np
 import mediapipe as mp
-import tensorflow as tf
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from dotenv import load_dotenv
-import pymongo
+from flask_sock import Sock
+from simple_websocket import ConnectionClosed
 import json
 import base64
-import pickle
-from urllib.parse import quote_plus
+import signal
+import hashlib
+import threading
+import queue
 import sys
 
 # models 디렉토리를 PATH에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
 
-# 환경 변수 로드
-load_dotenv()
-
 app = Flask(__name__)
 CORS(app)
+sock = Sock(app)
 
 # 데이터 경로 설정
 DATA_PATH = os.getenv('DATA_PATH', os.path.join(os.path.dirname(__file__), 'data', 'sign_data'))
 ANNOTATION_PATH = os.getenv('ANNOTATION_PATH', os.path.join(os.path.dirname(__file__), 'data', 'annotation.xlsx'))
 
 # 라우터 등록
-from routes.auth import auth_bp
+from routes.auth import auth_bp, token_cache, user_cache
 from routes.translations import translations_bp
 from routes.signs import signs_bp
 
@@ -35,156 +46,259 @@ app.register_blueprint(auth_bp, url_prefix='/api/auth')
 app.register_blueprint(translations_bp, url_prefix='/api/translations')
 app.register_blueprint(signs_bp, url_prefix='/api/signs')
 
-# MongoDB 연결
-def get_mongodb_connection():
+from services.model_registry import ModelRegistry
+from services.frame_buffer import FrameSessionStore
+from services.inference_scheduler import InferenceScheduler
+from services.frame_stream import LatestFrameSlot
+from services.hands_pool import HandsPool, HANDS_POOL_SIZE, HANDS_STREAM_POOL_SIZE
+from services.metrics import StageTimings
+from services.offload import BoundedExecutor, ExecutorBusy
+from services import tf_runtime
+from services.motion_gate import MotionGate, landmark_positions
+from services.result_cache import ResultCache
+from services import database
+from models.landmark_model import landmarks_to_vector
+
+# TensorFlow 스레드 수, GPU 메모리 설정 (모델을 로드하기 전에 적용해야 함)
+tf_runtime.configure_tensorflow()
+
+# MongoDB 연결 (모든 블루프린트가 하나의 클라이언트와 커넥션 풀을 공유)
+database.init_client()
+
+# 조회 쿼리에 필요한 인덱스 생성
+if os.getenv('MONGO_CREATE_INDEXES', 'True').lower() == 'true':
     try:
-        mongo_user = os.getenv('MONGO_USER', '')
-        mongo_password = os.getenv('MONGO_PASSWORD', '')
-        mongo_host = os.getenv('MONGO_HOST', 'localhost')
-        mongo_port = os.getenv('MONGO_PORT', '27017')
-        
-        if mongo_user and mongo_password:
-            uri = f"mongodb://{quote_plus(mongo_user)}:{quote_plus(mongo_password)}@{mongo_host}:{mongo_port}/"
-        else:
-            uri = f"mongodb://{mongo_host}:{mongo_port}/"
-            
-        client = pymongo.MongoClient(uri)
-        return client
+        database.ensure_indexes()
     except Exception as e:
-        print(f"MongoDB 연결 오류: {e}")
-        return None
+        print(f"MongoDB 인덱스 생성 오류: {e}")
 
 # MediaPipe Hands 설정
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(
-    static_image_mode=True,
-    max_num_hands=2,
-    min_detection_confidence=0.5
-)
-
-# 모델 로드
-def load_model():
-    model_path = os.path.join(os.path.dirname(__file__), 'models', 'sign_language_model.h5')
-    word_dict_path = os.path.join(os.path.dirname(__file__), 'models', 'word_dict.pickle')
-    
-    try:
-        # 모델 파일이 존재하는지 확인
-        if not os.path.exists(model_path):
-            print(f"모델 파일이 존재하지 않습니다. 새 모델을 생성합니다.")
-            
-            # 모델 빌드 코드 import
-            from models.Sonmin_DNN_model import build_sign_language_model
-            model = build_sign_language_model()
-            
-            # 모델 저장
-            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-            model.save(model_path)
-            print(f"모델이 {model_path}에 저장되었습니다.")
-            
-            # 기본 단어 사전 생성
-            word_dict = {
-                "안녕하세요": 0,
-                "감사합니다": 1,
-                "반갑습니다": 2,
-                "도와주세요": 3,
-                "이해했습니다": 4
-            }
-            
-            # 단어 사전 저장
-            with open(word_dict_path, 'wb') as f:
-                pickle.dump(word_dict, f)
-            
-            print(f"단어 사전이 {word_dict_path}에 저장되었습니다.")
-        else:
-            # 기존 모델 로드
-            model = tf.keras.models.load_model(model_path)
-            
-            # 단어 사전 로드
-            if os.path.exists(word_dict_path):
-                with open(word_dict_path, 'rb') as f:
-                    word_dict = pickle.load(f)
-            else:
-                # 기본 단어 사전 생성
-                word_dict = {
-                    "안녕하세요": 0,
-                    "감사합니다": 1,
-                    "반갑습니다": 2,
-                    "도와주세요": 3,
-                    "이해했습니다": 4
-                }
-                
-                # 단어 사전 저장
-                with open(word_dict_path, 'wb') as f:
-                    pickle.dump(word_dict, f)
-        
-        return model, word_dict
-    except Exception as e:
-        print(f"모델 로드 오류: {e}")
-        return None, None
+# HTTP 요청은 프레임이 독립적이므로 정지 이미지 모드 풀에서 요청마다 빌려서 사용
+image_hands_pool = HandsPool(HANDS_POOL_SIZE, static_image_mode=True)
+# 스트리밍 연결은 연결마다 추적 모드 인스턴스를 하나씩 빌려서 프레임 간 손 위치를 추적
+stream_hands_pool = HandsPool(HANDS_STREAM_POOL_SIZE, static_image_mode=False)
+# 처리 단계별 소요 시간
+stage_timings = StageTimings()
+
+# 모델 종류 - cnn_lstm: 이미지 시퀀스 CNN+LSTM 모델 / landmark: 손 랜드마크 시퀀스 경량 모델
+SIGN_MODEL_TYPE = os.getenv('SIGN_MODEL_TYPE', 'cnn_lstm')
+MODEL_NAMES = {
+    'cnn_lstm': ('sign_language_model.h5', 'word_dict.pickle', "CNN+LSTM 기반 딥러닝 모델"),
+    'landmark': ('landmark_model.h5', 'landmark_word_dict.pickle', "손 랜드마크 기반 경량 모델")
+}
+model_file, word_dict_file, MODEL_USED = MODEL_NAMES[SIGN_MODEL_TYPE]
+
+# 모델 레지스트리 (프로세스당 한 번만 로드)
+MODEL_PATH = os.getenv('MODEL_PATH', os.path.join(os.path.dirname(__file__), 'models', model_file))
+WORD_DICT_PATH = os.getenv('WORD_DICT_PATH', os.path.join(os.path.dirname(__file__), 'models', word_dict_file))
+# 추론 방식 - keras: Keras 모델 / tflite: models/export_tflite.py로 변환한 TFLite 모델
+INFERENCE_BACKEND = os.getenv('INFERENCE_BACKEND', 'keras')
+TFLITE_MODEL_PATH = os.getenv('TFLITE_MODEL_PATH', os.path.join(os.path.dirname(__file__), 'models', 'sign_language_model.tflite'))
+# 관리용 API 호출 시 필요한 토큰 (설정하지 않으면 관리용 API 비활성화)
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
+model_registry = ModelRegistry(MODEL_PATH, WORD_DICT_PATH, backend=INFERENCE_BACKEND,
+                               tflite_path=TFLITE_MODEL_PATH, model_type=SIGN_MODEL_TYPE,
+                               jit_compile=tf_runtime.TF_XLA_JIT,
+                               num_threads=tf_runtime.TF_NUM_INTRAOP_THREADS or None)
+
+# 서버 시작 시 모델을 미리 로드하고 워밍업
+if os.getenv('MODEL_PRELOAD', 'True').lower() == 'true':
+    model_registry.warmup()
+
+# SIGHUP 시그널을 받으면 모델 파일 변경 여부를 확인해서 다시 로드
+def handle_reload_signal(signum, frame):
+    threading.Thread(target=model_registry.reload, daemon=True).start()
+
+try:
+    signal.signal(signal.SIGHUP, handle_reload_signal)
+except (AttributeError, ValueError):
+    # Windows이거나 메인 스레드가 아닌 경우 시그널 리로드는 사용하지 않음
+    pass
+
+# 동시 요청을 모아서 배치로 추론하는 스케줄러
+# 스케줄러의 워커 스레드는 네이티브 스레드여야 하므로 비동기 모드에서는 사용하지 않음
+INFERENCE_BATCHING = SERVER_MODE != 'async' and os.getenv('INFERENCE_BATCHING', 'True').lower() == 'true'
+inference_scheduler = InferenceScheduler()
 
-# 이미지 시퀀스 전처리 (zero-padding)
-def zero_padding_4d(img_seq, max_len, xlen=120, ylen=67):
+# 수어 인식을 실행하는 제한된 크기의 실행 풀 (요청 처리 스레드/이벤트 루프와 분리)
+inference_executor = BoundedExecutor()
+
+# 클라이언트 세션별 프레임 버퍼
+frame_sessions = FrameSessionStore()
+
+# 손이 거의 움직이지 않은 프레임은 이전 예측을 재사용
+motion_gate = MotionGate()
+
+# 같은(거의 같은) 프레임의 MediaPipe 손 감지 결과 캐시
+result_cache = ResultCache()
+
+def get_session_id(data):
+    """
+    요청에서 세션 키를 결정. 세션 ID가 없으면 인증 토큰의 해시를, 둘 다 없으면 새 세션 ID를 발급
+    :return: (세션 ID, 새로 발급했는지 여부)
+    """
+    session_id = data.get('session_id') or request.headers.get('X-Session-Id')
+    if session_id:
+        return str(session_id), False
+    token = request.headers.get('Authorization', '').replace('Bearer ', '')
+    if token:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest(), False
+    return frame_sessions.new_session_id(), True
+
+# 응답 형식 기본값
+ANNOTATED_IMAGE_SCALE = float(os.getenv('ANNOTATED_IMAGE_SCALE', '1.0'))
+ANNOTATED_IMAGE_QUALITY = int(os.getenv('ANNOTATED_IMAGE_QUALITY', '95'))
+
+def parse_response_options(data, include_image=True):
     """
-    이미지 시퀸스들 앞에 0으로 된 이미지들 padding
-    텐서플로 모델에 넣기 위해서는 이미지 시퀸스의 길이를 모두 맞춰야 함
+    요청 데이터에서 응답 형식 옵션을 읽음
+    - include_image: 손 랜드마크를 그린 이미지 포함 여부
+    - landmarks: 손 랜드마크 좌표를 배열로 포함 (클라이언트에서 직접 그릴 때)
+    - image_scale: 주석 이미지 축소 비율 (0 < scale <= 1)
+    - image_quality: 주석 이미지 JPEG 품질 (1 ~ 100)
     """
-    if len(img_seq) == 0:
-        return np.zeros((max_len, ylen, xlen, 3))
+    def to_bool(value, default):
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value.lower() == 'true'
+        return bool(value)
     
-    img_seq = np.array(img_seq)
-    # 각 이미지 한 장의 크기
-    img_shape = img_seq.shape[1:]
-    # zero-padding으로 만들어야하는 이미지 개수
-    img_augment_len = max_len - img_seq.shape[0]
+    scale = float(data.get('image_scale', ANNOTATED_IMAGE_SCALE))
+    quality = int(data.get('image_quality', ANNOTATED_IMAGE_QUALITY))
+    return {
+        "include_image": to_bool(data.get('include_image'), include_image),
+        "landmarks": to_bool(data.get('landmarks'), False),
+        "image_scale": min(max(scale, 0.1), 1.0),
+        "image_quality": min(max(quality, 1), 100)
+    }
+
+# 손 랜드마크를 그린 이미지를 Base64 data URL로 인코딩
+def encode_annotated_image(frame, results, scale=1.0, quality=95):
+    if scale < 1.0:
+        # 축소한 이미지에 그리면 복사, 그리기, 인코딩 비용이 모두 줄어듦 (랜드마크 좌표는 0~1 비율)
+        annotated_frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    else:
+        # 손 랜드마크 시각화를 위한 이미지 복사
+        annotated_frame = frame.copy()
     
-    if img_augment_len <= 0:
-        # 이미지가 최대 길이보다 길면 최대 길이만큼만 사용
-        return img_seq[:max_len]
+    # 손 랜드마크 그리기
+    for hand_landmarks in results.multi_hand_landmarks:
+        mp_drawing.draw_landmarks(
+            annotated_frame,
+            hand_landmarks,
+            mp_hands.HAND_CONNECTIONS
+        )
     
-    # 해당하는 이미지의 크기를 가진 0 배열 생성
-    img_zero = np.zeros((img_augment_len, *img_shape))
-    img_seq = np.concatenate([img_zero, img_seq], axis=0)
-    return img_seq
+    _, buffer = cv2.imencode('.jpg', annotated_frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    annotated_image = base64.b64encode(buffer).decode('utf-8')
+    return f"data:image/jpeg;base64,{annotated_image}"
+
+# 손 랜드마크 좌표를 간결한 배열로 변환 [x0, y0, x1, y1, ...] (이미지 크기 대비 비율)
+def landmarks_to_list(results):
+    hand_list = []
+    for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+        handedness = None
+        if results.multi_handedness:
+            handedness = results.multi_handedness[i].classification[0].label
+        points = []
+        for lm in hand_landmarks.landmark:
+            points.append(round(lm.x, 4))
+            points.append(round(lm.y, 4))
+        hand_list.append({"handedness": handedness, "points": points})
+    return hand_list
+
+# 응답 옵션에 따라 주석 이미지와 랜드마크 좌표를 결과에 추가
+def attach_visuals(result, frame, results, options):
+    if options["include_image"]:
+        # 시각화 이미지를 Base64로 인코딩
+        with stage_timings.measure('encode'):
+            result["annotated_image"] = encode_annotated_image(frame, results, options["image_scale"],
+                                                               options["image_quality"])
+    if options["landmarks"]:
+        result["landmarks"] = landmarks_to_list(results)
+    return result
 
 # 수어 인식 함수
-def process_sign_language(frame_data):
+def process_sign_language(frame_data, session_id, options=None):
     # Base64 디코딩 및 이미지 변환
     try:
-        # MediaPipe를 사용한 손 랜드마크 추출
-        img_data = base64.b64decode(frame_data.split(',')[1])
-        nparr = np.frombuffer(img_data, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        with stage_timings.measure('decode'):
+            img_data = base64.b64decode(frame_data.split(',')[1])
+            nparr = np.frombuffer(img_data, np.uint8)
+            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        if options is None:
+            options = parse_response_options({})
+        if not result_cache.enabled:
+            return recognize_frame(frame, session_id, options)
         
+        # 재시도나 정지 자세처럼 거의 같은 프레임은 MediaPipe 손 감지 결과만 재사용
+        # 예측은 세션 시퀀스에 따라 달라지므로 캐시하지 않고, 프레임은 항상 세션 버퍼에 추가됨
+        cache_key = result_cache.key(frame)
+        results = result_cache.get(cache_key)
+        landmarks_cached = results is not None
+        if not landmarks_cached:
+            results = detect_hands(frame)
+            result_cache.set(cache_key, results)
+        result = recognize_frame(frame, session_id, options, results=results)
+        result["landmarks_cached"] = landmarks_cached
+        return result
+    except Exception as e:
+        print(f"수어 처리 오류: {e}")
+        return {
+            "error": f"처리 중 오류가 발생했습니다: {str(e)}"
+        }
+
+# MediaPipe를 사용한 손 랜드마크 추출
+def detect_hands(frame, hands=None):
+    """
+    :param frame: BGR 이미지
+    :param hands: 사용할 MediaPipe Hands 인스턴스. 없으면 정지 이미지 모드 풀에서 빌려서 사용
+    """
+    with stage_timings.measure('mediapipe'):
         # 이미지를 RGB로 변환
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
+        if hands is None:
+            with image_hands_pool.acquire() as pooled_hands:
+                return pooled_hands.process(frame_rgb)
+        return hands.process(frame_rgb)
+
+# 디코딩된 프레임 한 장으로 수어 인식
+def recognize_frame(frame, session_id, options=None, hands=None, results=None):
+    """
+    :param frame: BGR 이미지
+    :param session_id: 프레임 버퍼를 공유하는 세션 ID. None이면 저장소에 등록하지 않는 일회용 버퍼를 사용
+    :param options: parse_response_options()로 만든 응답 형식 옵션
+    :param hands: 사용할 MediaPipe Hands 인스턴스. 없으면 정지 이미지 모드 풀에서 빌려서 사용
+    :param results: 이미 계산된 MediaPipe 손 감지 결과. 있으면 MediaPipe를 다시 실행하지 않음
+    """
+    if options is None:
+        options = parse_response_options({})
+    try:
+        if results is None:
+            results = detect_hands(frame, hands)
+        
+        # 레지스트리에서 로드된 모델 가져오기
+        loaded = model_registry.get()
+        
+        if loaded is not None:
+            # 프레임 특징을 세션 프레임 버퍼에 추가 (손이 없는 프레임도 시간 정보로 사용)
+            with stage_timings.measure('preprocess'):
+                if SIGN_MODEL_TYPE == 'landmark':
+                    features = landmarks_to_vector(results)
+                else:
+                    # 모델 입력 크기로 리사이즈
+                    ylen, xlen = loaded.frame_shape[:2]
+                    features = cv2.resize(frame, (xlen, ylen))
+                session = frame_sessions.get(session_id, loaded.seq_len, features.shape, features.dtype)
+                with session.lock:
+                    session.buffer.append(features)
         
         if results.multi_hand_landmarks:
-            # 손 랜드마크 시각화를 위한 이미지 복사
-            annotated_frame = frame.copy()
-            
-            # 손 랜드마크 그리기
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(
-                    annotated_frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS
-                )
-            
-            # 이미지 전처리 (120x67 크기로 리사이즈)
-            resized_frame = cv2.resize(frame, (120, 67))
-            
-            # 시퀀스를 위한 배열 초기화
-            img_seq = []
-            
-            # 현재 프레임 추가
-            img_seq.append(resized_frame)
-            
-            # 모델 및 단어 사전 로드
-            model, word_dict = load_model()
-            
-            if model is None or word_dict is None:
+            if loaded is None:
                 # MediaPipe 기반의 간단한 손 제스처 인식
                 # 손가락 끝 랜드마크 인덱스
                 FINGER_TIPS = [mp_hands.HandLandmark.THUMB_TIP, mp_hands.HandLandmark.INDEX_FINGER_TIP,
@@ -239,47 +353,44 @@ def process_sign_language(frame_data):
                     gesture = "알 수 없는 제스처"
                     predicted_word = "알 수 없는 수어"
                 
-                # 시각화 이미지를 Base64로 인코딩
-                _, buffer = cv2.imencode('.jpg', annotated_frame)
-                annotated_image = base64.b64encode(buffer).decode('utf-8')
-                
-                return {
+                result = {
                     "predicted_word": predicted_word,
                     "gesture": gesture,
-                    "annotated_image": f"data:image/jpeg;base64,{annotated_image}",
                     "model_used": "MediaPipe 손 랜드마크 (모델 없음)"
                 }
+                return attach_visuals(result, frame, results, options)
             
-            # 이미지 시퀀스를 모델 입력 형태로 변환
-            # 모델 학습 시 사용된 최대 시퀀스 길이에 맞게 패딩
-            seq_len = 30  # 모델이 학습된 시퀀스 길이 (bigdata-3team 프로젝트 기준)
-            img_seq = zero_padding_4d(img_seq, seq_len)
+            # 마지막으로 추론한 프레임 이후 손이 거의 움직이지 않았으면 이전 예측을 재사용
+            positions = landmark_positions(results)
+            with session.lock:
+                prediction = motion_gate.reuse(session, positions, loaded.version)
+                if prediction is None:
+                    # 세션 버퍼에서 최근 프레임 시퀀스를 가져옴 (부족한 프레임은 앞쪽을 0으로 채움)
+                    img_seq = session.buffer.sequence()
             
-            # 모델 입력 형태로 변환
-            img_seq = img_seq.reshape(1, seq_len, 67, 120, 3)
-            
-            # 모델 예측
-            prediction = model.predict(img_seq)[0]
-            
-            # 예측된 인덱스를 단어로 변환
-            # 단어 사전 반전 (인덱스 -> 단어)
-            idx_word_dict = {v: k for k, v in word_dict.items()}
+            inference_skipped = prediction is not None
+            if not inference_skipped:
+                # 모델 예측 (배치 스케줄러가 동시 요청을 모아서 한 번에 추론)
+                with stage_timings.measure('inference'):
+                    if INFERENCE_BATCHING:
+                        prediction = inference_scheduler.predict(loaded, img_seq)
+                    else:
+                        prediction = loaded.predict(img_seq[np.newaxis].astype(np.float32))[0]
+                with session.lock:
+                    motion_gate.remember(session, positions, loaded.version, prediction)
             
-            # 가장 높은 확률의 클래스 인덱스 찾기
-            predicted_idx = np.argmax(prediction)
-            predicted_word = idx_word_dict.get(predicted_idx, "알 수 없는 수어")
+            # 가장 높은 확률의 클래스 인덱스 찾기 (역방향 사전은 로드 시 미리 계산됨)
+            predicted_idx = int(np.argmax(prediction))
+            predicted_word = loaded.idx_word_dict.get(predicted_idx, "알 수 없는 수어")
             confidence = float(prediction[predicted_idx])
             
-            # 시각화 이미지를 Base64로 인코딩
-            _, buffer = cv2.imencode('.jpg', annotated_frame)
-            annotated_image = base64.b64encode(buffer).decode('utf-8')
-            
-            return {
+            result = {
                 "predicted_word": predicted_word,
                 "confidence": confidence,
-                "annotated_image": f"data:image/jpeg;base64,{annotated_image}",
-                "model_used": "CNN+LSTM 기반 딥러닝 모델"
+                "model_used": MODEL_USED,
+                "inference_skipped": inference_skipped
             }
+            return attach_visuals(result, frame, results, options)
         else:
             return {
                 "error": "손 랜드마크를 찾을 수 없습니다.",
@@ -301,22 +412,168 @@ def translate():
                 "error": "프레임 데이터가 없습니다."
             }), 400
         
-        result = process_sign_language(data['frame'])
+        session_id, issued = get_session_id(data)
+        try:
+            options = parse_response_options(data)
+        except (TypeError, ValueError):
+            return jsonify({
+                "error": "응답 형식 옵션이 올바르지 않습니다."
+            }), 400
+        
+        try:
+            # 세션 ID 없이 온 요청은 다시 올지 알 수 없으므로 세션 저장소에 버퍼를 만들지 않음
+            # 발급한 ID를 응답으로 돌려주고, 클라이언트가 다음 요청에 보내면 그때부터 세션이 유지됨
+            result = inference_executor.run(process_sign_language, data['frame'],
+                                            None if issued else session_id, options)
+        except ExecutorBusy:
+            return jsonify({
+                "error": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+            }), 503
+        result['session_id'] = session_id
         return jsonify(result)
     except Exception as e:
         return jsonify({
             "error": f"요청 처리 중 오류가 발생했습니다: {str(e)}"
         }), 500
 
+# 수어 번역 스트리밍 (WebSocket)
+@sock.route('/ws/translate')
+def translate_stream(ws):
+    """
+    클라이언트는 JPEG 프레임을 바이너리 메시지로 계속 보내고, 서버는 예측 결과를 JSON 텍스트 메시지로 보냄
+    텍스트 메시지 {"action": "reset"}을 보내면 지금까지 쌓인 프레임 시퀀스를 비우고,
+    {"action": "options", ...}을 보내면 /api/translate와 같은 응답 형식 옵션을 바꿈 (기본값은 이미지 제외)
+    수신 스레드는 최신 프레임 하나만 보관하므로 추론이 밀리면 오래된 프레임은 버려짐
+    """
+    session_id = frame_sessions.new_session_id()
+    slot = LatestFrameSlot()
+    stream = {"options": parse_response_options({}, include_image=False)}
+    
+    def receive_frames():
+        try:
+            while True:
+                message = ws.receive()
+                if isinstance(message, str):
+                    try:
+                        control = json.loads(message)
+                    except ValueError:
+                        continue
+                    if not isinstance(control, dict):
+                        continue
+                    if control.get('action') == 'reset':
+                        frame_sessions.discard(session_id)
+                    elif control.get('action') == 'options':
+                        try:
+                            stream["options"] = parse_response_options(control, include_image=False)
+                        except (TypeError, ValueError):
+                            pass
+                    continue
+                slot.put(message)
+        except ConnectionClosed:
+            pass
+        finally:
+            slot.close()
+    
+    try:
+        # 연결 동안 사용할 추적 모드 Hands 인스턴스
+        with stream_hands_pool.acquire(timeout=0) as stream_hands:
+            threading.Thread(target=receive_frames, name=f"ws-{session_id[:8]}", daemon=True).start()
+            ws.send(json.dumps({"session_id": session_id}))
+            while True:
+                item = slot.take()
+                if item is None:
+                    break
+                frame_id, data = item
+                with stage_timings.measure('decode'):
+                    frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+                if frame is None:
+                    result = {"error": "이미지를 디코딩할 수 없습니다."}
+                else:
+                    try:
+                        result = inference_executor.run(recognize_frame, frame, session_id, stream["options"],
+                                                        hands=stream_hands)
+                    except ExecutorBusy:
+                        result = {"error": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."}
+                result['frame_id'] = frame_id
+                result['dropped_frames'] = slot.dropped
+                ws.send(json.dumps(result, ensure_ascii=False))
+    except queue.Empty:
+        ws.send(json.dumps({"error": "동시 스트리밍 연결 수를 초과했습니다. 잠시 후 다시 시도해주세요."}, ensure_ascii=False))
+    except ConnectionClosed:
+        pass
+    finally:
+        slot.close()
+        frame_sessions.discard(session_id)
+
 # 서버 상태 확인 API
 @app.route('/api/health', methods=['GET'])
 def health_check():
+    db_status = database.check_ready()
+    return jsonify({
+        "status": "ok" if db_status["ok"] else "degraded",
+        "version": "1.0.0",
+        "model": model_registry.status(),
+        "database": db_status,
+        "sessions": frame_sessions.stats()
+    })
+
+# 준비 상태 확인 API (로드밸런서/오케스트레이터용). 모델과 DB가 모두 준비되어야 200
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    db_status = database.check_ready()
+    model_status = model_registry.status()
+    ready = db_status["ok"] and model_status["loaded"]
+    return jsonify({
+        "ready": ready,
+        "model": model_status,
+        "database": db_status
+    }), 200 if ready else 503
+
+# 추론 관련 지표 조회 API
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    return jsonify({
+        "stages": stage_timings.snapshot(),
+        "hands_pool": {
+            "image": image_hands_pool.stats(),
+            "stream": stream_hands_pool.stats()
+        },
+        "inference": inference_scheduler.stats.snapshot(),
+        "executor": inference_executor.stats(),
+        "motion_gate": motion_gate.stats(),
+        "result_cache": result_cache.stats(),
+        "tf_runtime": tf_runtime.status(),
+        "sessions": frame_sessions.stats(),
+        "auth": {
+            "tokens": token_cache.stats(),
+            "users": user_cache.stats()
+        }
+    })
+
+# 모델 핫 리로드 API
+@app.route('/api/model/reload', methods=['POST'])
+def reload_model():
+    if not ADMIN_TOKEN or request.headers.get('X-Admin-Token') != ADMIN_TOKEN:
+        return jsonify({
+            "error": "권한이 없습니다."
+        }), 403
+    
+    force = request.args.get('force', 'false').lower() == 'true'
+    reloaded = model_registry.reload(force=force)
     return jsonify({
-        "status": "ok",
-        "version": "1.0.0"
+        "reloaded": reloaded,
+        "model": model_registry.status()
     })
 
 # 메인 실행
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG', 'False').lower() == 'true') 
\ No newline at end of file
+    if SERVER_MODE == 'async':
+        from gevent.pool import Pool
+        from gevent.pywsgi import WSGIServer
+        # 연결마다 greenlet 하나를 사용하므로 대기 중인 연결이 많아도 스레드를 점유하지 않음
+        max_connections = int(os.environ.get('ASYNC_MAX_CONNECTIONS', 10000))
+        print(f"비동기 모드(gevent)로 실행: 포트 {port}, 최대 연결 {max_connections}")
+        WSGIServer(('0.0.0.0', port), app, spawn=Pool(max_connections)).serve_forever()
+    else:
+        app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG', 'False').lower() == 'true') 
\ No newline at end of file
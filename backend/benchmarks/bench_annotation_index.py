@@ -0,0 +1,119 @@
+"""
+read_ai의 폴더 스캔에서 어노테이션 조회 방식 비교 (가짜 데이터셋 사용, 이미지는 읽지 않음)
+- 기존 방식: 폴더마다 DataFrame 전체를 folder_name으로 필터링 (폴더 수 x 어노테이션 행 수)
+- 인덱스 방식: 어노테이션을 폴더 이름 사전으로 한 번 만들고 폴더마다 사전 조회
+openpyxl이 설치되어 있으면 .xlsx 파싱과 pickle로 저장한 인덱스 로드 시간도 비교
+
+사용법:
+    python benchmarks/bench_annotation_index.py [--folders 10000] [--frames 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, 'models'))
+
+from models.dataset_prepare import build_annotation_index, load_annotation_index, scan_dataset
+
+SIGN_TYPES = ["단어", "단어", "단어", "문장"]
+
+
+def make_dataset(root, folders, frames):
+    """
+    sign_data와 같은 구조의 폴더와 빈 이미지 파일, 어노테이션 DataFrame 생성
+    숫자 라벨과 어노테이션이 없는 폴더도 섞어서 read_ai의 모든 분기를 거치게 함
+    """
+    data_path = os.path.join(root, "sign_data")
+    os.makedirs(data_path)
+    rows = []
+    for i in range(folders):
+        folder_name = f"KETI_SL_{i:010d}"
+        os.makedirs(os.path.join(data_path, folder_name))
+        for j in range(frames):
+            open(os.path.join(data_path, folder_name, f"{folder_name}_{j:03d}.jpg"), "wb").close()
+        # 100개 중 하나는 어노테이션 없음
+        if i % 100 == 99:
+            continue
+        label = i % 10 if i % 50 == 0 else f"단어{i % 500}"
+        rows.append({"파일명": f"{folder_name}.MOV", "한국어": label, "타입(단어/문장)": SIGN_TYPES[i % 4]})
+    dataset_annotation = pd.DataFrame(rows)
+    dataset_annotation.loc[(dataset_annotation["한국어"].map(type) == int), "타입(단어/문장)"] = "숫자"
+    dataset_annotation["folder_name"] = dataset_annotation["파일명"].str[:-4]
+    return data_path, dataset_annotation
+
+
+def scan_dataset_filtered(data_path, dataset_annotation):
+    """
+    인덱스를 도입하기 전 read_ai의 폴더 스캔 방식
+    """
+    folder_list = os.listdir(data_path)
+    items = []
+    for i in range(len(folder_list)):
+        img_path = os.path.join(data_path, folder_list[i])
+        if not os.path.isdir(img_path):
+            continue
+        if dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].empty:
+            continue
+        if dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].iloc[0]["타입(단어/문장)"] == "문장":
+            continue
+        elif dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].iloc[0]["타입(단어/문장)"] == "숫자":
+            continue
+        img_list = os.listdir(img_path)
+        img_list.sort()
+        label = dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].loc[:, "한국어"].values[0]
+        if type(label) == int:
+            label = str(label)
+        items.append((folder_list[i], label, [os.path.join(img_path, name) for name in img_list]))
+    return items
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--folders', type=int, default=10000)
+    parser.add_argument('--frames', type=int, default=3, help='폴더당 이미지 파일 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        data_path, dataset_annotation = make_dataset(root, args.folders, args.frames)
+        print(f"폴더 {args.folders}개, 어노테이션 {len(dataset_annotation)}행")
+
+        # 디렉토리 캐시를 데워서 두 방식이 같은 조건에서 측정되도록 함
+        scan_dataset(data_path, build_annotation_index(dataset_annotation))
+
+        expected, filtered_time = timed(lambda: scan_dataset_filtered(data_path, dataset_annotation))
+        index, index_time = timed(lambda: build_annotation_index(dataset_annotation))
+        actual, scan_time = timed(lambda: scan_dataset(data_path, index))
+        print(f"같은 결과: {sorted(expected) == sorted(actual)} ({len(actual)}개 시퀀스)")
+        print(f"DataFrame 필터링: {filtered_time:8.3f}초")
+        print(f"인덱스 생성:      {index_time:8.3f}초")
+        print(f"인덱스 조회 스캔: {scan_time:8.3f}초")
+        print(f"속도 향상: {filtered_time / (index_time + scan_time):.1f}x")
+
+        annotation_path = os.path.join(root, "annotation.xlsx")
+        try:
+            dataset_annotation.drop(columns=["folder_name"]).to_excel(annotation_path, index=False)
+        except ImportError:
+            print("openpyxl이 없어서 .xlsx 파싱 비교는 건너뜀")
+            return
+        cache_dir = os.path.join(root, "cache")
+        _, parse_time = timed(lambda: load_annotation_index(annotation_path, cache_dir=cache_dir))
+        cached, load_time = timed(lambda: load_annotation_index(annotation_path, cache_dir=cache_dir))
+        print(f"같은 인덱스: {cached == index}")
+        print(f".xlsx 파싱 + 인덱스 저장: {parse_time:8.3f}초")
+        print(f"저장된 인덱스 로드:       {load_time:8.3f}초")
+
+
+if __name__ == '__main__':
+    main()
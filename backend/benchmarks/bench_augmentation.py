@@ -0,0 +1,131 @@
+"""
+프레임 단위 데이터 증강(translate, rotate_img, ...)과 시퀀스 단위 증강(apply_data_augmentation)의 결과 차이와 속도 비교
+두 방식에 같은 시드를 주면 같은 랜덤값을 같은 순서로 뽑으므로 결과를 픽셀 단위로 비교할 수 있음
+회전은 프레임 단위 방식이 3차 스플라인, 시퀀스 단위 방식이 양선형 보간이라 값이 조금 다름
+
+사용법:
+    python benchmarks/bench_augmentation.py [--sequences 16] [--frames 30] [--padding 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, 'models'))
+
+from models.data_augmentation import (apply_data_augmentation, change_channel_ratio, clipped_zoom, gaussian_noise,
+                                      rotate_img, translate)
+
+PROCESSES = {
+    "translate": [1],
+    "rotate": [2],
+    "gaussian": [3],
+    "channel ratio": [4],
+    "zoom": [5],
+    "translate -> rotate -> gaussian": [1, 2, 3],
+    "zoom -> rotate -> gaussian": [5, 2, 3],
+}
+
+
+def apply_data_augmentation_per_frame(img_seq, process):
+    """
+    시퀀스 단위 증강을 도입하기 전의 apply_data_augmentation (프레임마다 변환 함수 호출)
+    """
+    img_seq = img_seq.copy()
+    for type in process:
+        if type == 1:
+            for i in range(img_seq.shape[0]):
+                temp = img_seq[i]
+                direction = np.random.choice(["right", "left", "down", "up"], size=1)[0]
+                shift = np.random.randint(10, 20, size=1)[0]
+                for j in range(temp.shape[0]):
+                    temp[j] = translate(temp[j], shift=shift, direction=direction)
+                img_seq[i] = temp
+        elif type == 2:
+            for i in range(img_seq.shape[0]):
+                temp = img_seq[i]
+                angle = np.random.randint(-20, 21, size=1)[0]
+                for j in range(temp.shape[0]):
+                    temp[j] = rotate_img(temp[j], angle=angle)
+                img_seq[i] = temp
+        elif type == 3:
+            for i in range(img_seq.shape[0]):
+                mean = np.random.uniform(0, 0.5, size=1)[0]
+                std = np.random.uniform(0.01, 0.1, size=1)[0]
+                img_seq[i] = gaussian_noise(img_seq[i], mean=mean, sigma=std)
+        elif type == 4:
+            for i in range(img_seq.shape[0]):
+                temp = img_seq[i]
+                color = np.random.choice(["r", "g", "b"], size=1, replace=False)[0]
+                ratio = np.random.uniform(0, 1, size=1)[0]
+                for j in range(temp.shape[0]):
+                    temp[j] = change_channel_ratio(temp[j], **{color: ratio})
+                img_seq[i] = temp
+        elif type == 5:
+            for i in range(img_seq.shape[0]):
+                temp = img_seq[i]
+                ratio = np.random.uniform(1.0, 1.5, size=1)[0]
+                for j in range(temp.shape[0]):
+                    temp[j] = clipped_zoom(temp[j], zoom_factor=ratio)
+                img_seq[i] = temp
+    return img_seq
+
+
+def make_sequences(sequences, frames, padding, ylen=67, xlen=120, seed=0):
+    """
+    read_ai 결과와 같은 형태의 가짜 시퀀스 (앞쪽 padding개 프레임은 zero-padding)
+    부드러운 그라디언트에 노이즈를 더해서 보간 차이가 실제 이미지와 비슷한 크기로 나타나게 함
+    """
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:ylen, 0:xlen]
+    base = np.stack([xx / xlen, yy / ylen, (xx + yy) / (xlen + ylen)], axis=-1)
+    X = base[np.newaxis, np.newaxis] + rng.normal(0, 0.05, size=(sequences, frames, ylen, xlen, 3))
+    X = np.clip(X * 255, 1, 255).astype(np.float32)
+    X[:, :padding] = 0
+    return X
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sequences', type=int, default=16)
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--padding', type=int, default=10, help='시퀀스 앞쪽 zero-padding 프레임 수')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    X = make_sequences(args.sequences, args.frames, args.padding, seed=args.seed)
+    print(f"입력 형태: {X.shape}, 픽셀 범위 0~255")
+    print("| 증강 | 프레임 단위(ms) | 시퀀스 단위(ms) | 속도 향상 | 최대 오차 | 평균 오차 |")
+    print("|---|---|---|---|---|---|")
+    for name, process in PROCESSES.items():
+        def per_frame():
+            np.random.seed(args.seed)
+            return apply_data_augmentation_per_frame(X, process)
+
+        def batched():
+            np.random.seed(args.seed)
+            return apply_data_augmentation(X, process)
+
+        expected, per_frame_time = timed(per_frame, args.repeat)
+        actual, batched_time = timed(batched, args.repeat)
+        error = np.abs(expected.astype(np.float64) - actual)
+        print(f"| {name} | {per_frame_time * 1000:.1f} | {batched_time * 1000:.1f} | "
+              f"{per_frame_time / batched_time:.1f}x | {error.max():.3g} | {error.mean():.3g} |")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+I/O 위주의 요청(번역 내역 조회)이 많이 몰릴 때 수어 번역 요청의 처리량과 지연 시간 측정
+실행 중인 서버에 요청을 보내므로 서버를 SERVER_MODE=sync, SERVER_MODE=async로 각각 실행해서 결과를 비교
+
+사용법:
+    python benchmarks/bench_concurrency.py --url http://localhost:5000 --image hand.jpg --token <JWT>
+        [--duration 20] [--translate-clients 8] [--history-clients 500]
+
+--token이 없으면 I/O 요청으로 /api/health(MongoDB ping)를 사용
+"""
+import argparse
+import base64
+import threading
+import time
+
+import numpy as np
+import requests
+
+
+def translate_client(url, frame, stop, latencies, errors):
+    session = requests.Session()
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            response = session.post(f"{url}/api/translate", json={"frame": frame, "include_image": False},
+                                    timeout=30)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(response.status_code)
+        except requests.RequestException:
+            errors.append('error')
+
+
+def history_client(url, token, stop, latencies, errors):
+    session = requests.Session()
+    if token:
+        path = "/api/translations/recent"
+        session.headers['Authorization'] = f"Bearer {token}"
+    else:
+        path = "/api/health"
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            response = session.get(f"{url}{path}", timeout=30)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(response.status_code)
+        except requests.RequestException:
+            errors.append('error')
+
+
+def report(name, latencies, errors, duration):
+    if not latencies:
+        print(f"{name:<10} 성공한 요청 없음 (오류 {len(errors)}건)")
+        return
+    ms = np.array(latencies) * 1000
+    print(f"{name:<10} 처리량 {len(ms) / duration:8.1f} req/s  p50 {np.percentile(ms, 50):8.1f}ms  "
+          f"p99 {np.percentile(ms, 99):8.1f}ms  오류 {len(errors)}건")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--image', required=True, help='번역 요청에 사용할 손 이미지(JPEG)')
+    parser.add_argument('--token', default='', help='번역 내역 조회에 사용할 JWT')
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--translate-clients', type=int, default=8)
+    parser.add_argument('--history-clients', type=int, default=500)
+    args = parser.parse_args()
+
+    with open(args.image, 'rb') as f:
+        frame = "data:image/jpeg;base64," + base64.b64encode(f.read()).decode()
+
+    stop = threading.Event()
+    translate_latencies, translate_errors = [], []
+    history_latencies, history_errors = [], []
+    threads = [
+        threading.Thread(target=translate_client, args=(args.url, frame, stop, translate_latencies, translate_errors),
+                         daemon=True)
+        for _ in range(args.translate_clients)
+    ] + [
+        threading.Thread(target=history_client, args=(args.url, args.token, stop, history_latencies, history_errors),
+                         daemon=True)
+        for _ in range(args.history_clients)
+    ]
+
+    print(f"번역 클라이언트 {args.translate_clients}개, 조회 클라이언트 {args.history_clients}개, {args.duration}초")
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    report("번역", translate_latencies, translate_errors, args.duration)
+    report("조회", history_latencies, history_errors, args.duration)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+model.predict와 고정 시그니처 추론 함수(LoadedModel.predict)의 호출당 지연 시간 비교
+
+사용법:
+    python benchmarks/bench_inference.py [--model 모델경로] [--iters 200] [--batch 1]
+모델 파일을 지정하지 않으면 build_sign_language_model로 만든 모델을 사용
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import tensorflow as tf
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, 'models'))
+
+from models.Sonmin_DNN_model import build_sign_language_model
+from services.model_registry import build_inference_function
+
+
+def measure(fn, inputs, iters, warmup=5):
+    for _ in range(warmup):
+        fn(inputs)
+    latencies = []
+    for _ in range(iters):
+        start = time.perf_counter()
+        fn(inputs)
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+def report(name, latencies):
+    print(f"{name:<20} mean {latencies.mean():8.2f}ms  p50 {np.percentile(latencies, 50):8.2f}ms  "
+          f"p99 {np.percentile(latencies, 99):8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default=None, help='.h5 모델 경로')
+    parser.add_argument('--iters', type=int, default=200)
+    parser.add_argument('--batch', type=int, default=1)
+    args = parser.parse_args()
+
+    if args.model:
+        model = tf.keras.models.load_model(args.model)
+    else:
+        model = build_sign_language_model()
+    input_shape = model.input_shape[1:]
+    print(f"입력 형태: {input_shape}, 배치 크기: {args.batch}, 반복 횟수: {args.iters}")
+
+    inputs = np.random.randint(0, 256, size=(args.batch, *input_shape)).astype(np.float32)
+    infer = build_inference_function(model)
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    expected = model.predict(inputs, verbose=0)
+    actual = infer(tf.convert_to_tensor(inputs)).numpy()
+    print(f"최대 오차: {np.abs(expected - actual).max():.2e}")
+
+    baseline = measure(lambda x: model.predict(x, verbose=0), inputs, args.iters)
+    compiled = measure(lambda x: infer(tf.convert_to_tensor(x, dtype=tf.float32)).numpy(), inputs, args.iters)
+    report("model.predict", baseline)
+    report("tf.function", compiled)
+    print(f"속도 향상: {np.median(baseline) / np.median(compiled):.2f}x (p50 기준)")
+    print(f"트레이싱 횟수: {infer.experimental_get_tracing_count()}")
+
+
+if __name__ == '__main__':
+    main()
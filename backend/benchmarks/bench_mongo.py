@@ -0,0 +1,69 @@
+"""
+요청마다 MongoClient를 새로 만드는 방식과 공유 클라이언트(services.database)의 요청 지연 시간 비교
+실제 MongoDB 서버가 필요하며, 접속 정보는 서버와 같은 환경 변수(MONGO_HOST 등)를 사용
+
+사용법:
+    python benchmarks/bench_mongo.py [--requests 500] [--concurrency 16]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pymongo
+from dotenv import load_dotenv
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from services import database
+
+
+def per_request_client():
+    # 기존 블루프린트의 get_db()와 같은 방식: 요청마다 새 클라이언트 생성
+    client = pymongo.MongoClient(database.build_mongo_uri())
+    client[database.MONGO_DB_NAME].users.find_one({'email': 'benchmark@example.com'})
+    client.close()
+
+
+def shared_client():
+    database.get_db().users.find_one({'email': 'benchmark@example.com'})
+
+
+def run(fn, requests, concurrency):
+    def timed(_):
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.array(list(executor.map(timed, range(requests)))) * 1000
+    elapsed = time.perf_counter() - start
+    return latencies, requests / elapsed
+
+
+def report(name, latencies, throughput):
+    print(f"{name:<20} p50 {np.percentile(latencies, 50):8.2f}ms  p99 {np.percentile(latencies, 99):8.2f}ms  "
+          f"처리량 {throughput:8.1f} req/s")
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"요청 수: {args.requests}, 동시성: {args.concurrency}")
+    # 공유 클라이언트는 첫 연결 비용을 제외하고 측정
+    database.get_client().admin.command('ping')
+
+    report("요청마다 새 클라이언트", *run(per_request_client, args.requests, args.concurrency))
+    report("공유 클라이언트", *run(shared_client, args.requests, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+TensorFlow 런타임 설정(스레드 수, oneDNN, XLA)별 추론 지연 시간과 처리량 비교
+스레드 수와 oneDNN은 프로세스 시작 시에만 바꿀 수 있으므로 설정마다 별도 프로세스에서 측정
+모델은 build_sign_language_model(Sonmin CNN+LSTM)과 같은 입력 형태를 사용
+
+사용법:
+    python benchmarks/bench_tf_runtime.py [--intra 1 2 4 0] [--inter 1 2] [--onednn 0 1] [--xla 0 1]
+        [--batch 1] [--iters 200] [--model 모델경로]
+스레드 수 0은 TensorFlow 기본값(CPU 코어 수)
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_single(args):
+    """
+    현재 프로세스의 환경 변수 설정으로 추론 시간을 측정해서 JSON으로 출력 (--single 모드)
+    """
+    sys.path.append(BACKEND_DIR)
+    sys.path.append(os.path.join(BACKEND_DIR, 'models'))
+
+    import numpy as np
+    import tensorflow as tf
+    from services import tf_runtime
+
+    tf_runtime.configure_tensorflow()
+
+    from services.model_registry import build_inference_function
+    if args.model:
+        model = tf.keras.models.load_model(args.model)
+    else:
+        from models.Sonmin_DNN_model import build_sign_language_model
+        model = build_sign_language_model()
+
+    infer = build_inference_function(model, jit_compile=tf_runtime.TF_XLA_JIT)
+    inputs = tf.convert_to_tensor(
+        np.random.randint(0, 256, size=(args.batch, *model.input_shape[1:])).astype(np.float32))
+
+    for _ in range(5):
+        infer(inputs).numpy()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(args.iters):
+        call_start = time.perf_counter()
+        infer(inputs).numpy()
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    print(json.dumps({
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "throughput": args.batch * args.iters / elapsed,
+        "runtime": tf_runtime.status()
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--intra', type=int, nargs='+', default=[1, 2, 4, 0])
+    parser.add_argument('--inter', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--onednn', type=int, nargs='+', default=[0, 1])
+    parser.add_argument('--xla', type=int, nargs='+', default=[0, 1])
+    parser.add_argument('--batch', type=int, default=1)
+    parser.add_argument('--iters', type=int, default=200)
+    parser.add_argument('--model', default=None, help='.h5 모델 경로')
+    parser.add_argument('--single', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args)
+        return
+
+    print(f"배치 크기: {args.batch}, 반복 횟수: {args.iters}, CPU 코어 {os.cpu_count()}개")
+    print("| intra | inter | oneDNN | XLA | p50(ms) | p99(ms) | 처리량(샘플/s) |")
+    print("|---|---|---|---|---|---|---|")
+    for intra, inter, onednn, xla in itertools.product(args.intra, args.inter, args.onednn, args.xla):
+        env = dict(os.environ,
+                   TF_NUM_INTRAOP_THREADS=str(intra),
+                   TF_NUM_INTEROP_THREADS=str(inter),
+                   TF_ENABLE_ONEDNN_OPTS=str(onednn),
+                   TF_XLA_JIT=str(bool(xla)),
+                   TF_CPP_MIN_LOG_LEVEL='2')
+        command = [sys.executable, os.path.abspath(__file__), '--single',
+                   '--batch', str(args.batch), '--iters', str(args.iters)]
+        if args.model:
+            command += ['--model', args.model]
+        result = subprocess.run(command, env=env, capture_output=True, text=True)
+        try:
+            # 모델 로드 로그 뒤 마지막 줄이 측정 결과
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            print(f"| {intra} | {inter} | {onednn} | {xla} | 실패 | | |")
+            continue
+        print(f"| {intra} | {inter} | {onednn} | {xla} | {stats['p50_ms']:.2f} | {stats['p99_ms']:.2f} | "
+              f"{stats['throughput']:.1f} |")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+gunicorn 워커 수별 수어 번역 처리량, 지연 시간, 메모리 사용량 측정
+워커 수마다 gunicorn.conf.py로 서버를 새로 띄우고, 준비가 끝나면 동시에 번역 요청을 보냄
+결과 표로 docs/server-sizing.md의 방법에 따라 워커 수를 정함 (Linux 전용, MongoDB는 없어도 됨)
+
+사용법:
+    python benchmarks/bench_workers.py --image hand.jpg [--workers 1 2 4 8] [--clients 16] [--duration 30]
+"""
+import argparse
+import base64
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_ready(url, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            # MongoDB 없이도 측정할 수 있도록 모델 로드 여부만 확인
+            # MongoDB가 없으면 health가 서버 선택 시간 초과까지 기다리므로 그보다 길게 기다림
+            status = requests.get(f"{url}/api/health", timeout=15).json()
+            if status.get("model", {}).get("loaded"):
+                return True
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(1)
+    return False
+
+
+def process_tree_rss_mb(pid):
+    """
+    프로세스와 직접 자식 프로세스의 RSS 합계(MB)
+    """
+    output = subprocess.run(['ps', '-eo', 'pid=,ppid=,rss='], capture_output=True, text=True).stdout
+    rows = [tuple(int(v) for v in line.split()) for line in output.splitlines() if line.strip()]
+    # gunicorn 워커는 마스터의 직접 자식 프로세스
+    return sum(rss for row_pid, ppid, rss in rows if pid in (row_pid, ppid)) / 1024
+
+
+def load_test(url, frame, clients, duration):
+    stop = threading.Event()
+    latencies, errors = [], []
+
+    def client():
+        session = requests.Session()
+        # 클라이언트마다 세션을 나눠서 실제 사용처럼 프레임 버퍼를 따로 쌓음
+        session.headers['X-Session-Id'] = f"bench-{threading.get_ident()}"
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                response = session.post(f"{url}/api/translate", json={"frame": frame, "include_image": False},
+                                        timeout=60)
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors.append(response.status_code)
+            except requests.RequestException:
+                errors.append('error')
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=60)
+    return np.array(latencies) * 1000, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--image', required=True, help='번역 요청에 사용할 손 이미지(JPEG)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--startup-timeout', type=float, default=300)
+    args = parser.parse_args()
+
+    with open(args.image, 'rb') as f:
+        frame = "data:image/jpeg;base64," + base64.b64encode(f.read()).decode()
+    url = f"http://127.0.0.1:{args.port}"
+
+    print(f"CPU 코어 {os.cpu_count()}개, 동시 클라이언트 {args.clients}개, 워커 수별 {args.duration}초")
+    print("| 워커 수 | 워커당 TF 스레드 | 처리량(req/s) | p50(ms) | p99(ms) | 메모리 합계(MB) | 오류 |")
+    print("|---|---|---|---|---|---|---|")
+    for workers in args.workers:
+        # 같은 이미지를 반복해서 보내므로 손 감지 캐시와 움직임 기준 추론 생략을 꺼서 매 요청 MediaPipe와 모델을 실행
+        # MongoDB가 없어도 health 확인이 오래 걸리지 않도록 서버 선택 시간을 줄임
+        env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(args.port),
+                   MONGO_CREATE_INDEXES='False', MONGO_SERVER_SELECTION_TIMEOUT_MS='500',
+                   RESULT_CACHE='False', MOTION_GATE='False')
+        server = subprocess.Popen([sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py', 'app:app'],
+                                  cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if not wait_ready(url, args.startup_timeout):
+                print(f"| {workers} | - | 서버 시작 실패 | | | | |")
+                continue
+            # 모든 워커가 워밍업을 마치도록 잠시 요청을 보냄
+            load_test(url, frame, args.clients, min(5.0, args.duration))
+            latencies, errors = load_test(url, frame, args.clients, args.duration)
+            memory = process_tree_rss_mb(server.pid)
+            tf_threads = max(1, (os.cpu_count() or 1) // workers)
+            if len(latencies):
+                print(f"| {workers} | {tf_threads} | {len(latencies) / args.duration:.1f} | "
+                      f"{np.percentile(latencies, 50):.1f} | {np.percentile(latencies, 99):.1f} | "
+                      f"{memory:.0f} | {len(errors)} |")
+            else:
+                print(f"| {workers} | {tf_threads} | 0 | - | - | {memory:.0f} | {len(errors)} |")
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+
+
+if __name__ == '__main__':
+    main()
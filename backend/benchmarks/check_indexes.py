@@ -0,0 +1,40 @@
+"""
+블루프린트의 주요 조회 쿼리가 인덱스를 사용하는지 explain()으로 확인
+COLLSCAN(컬렉션 전체 스캔)이나 SORT(메모리 정렬) 단계가 있으면 실패로 보고 종료 코드 1을 반환
+실제 MongoDB 서버가 필요하며, 접속 정보는 서버와 같은 환경 변수(MONGO_HOST 등)를 사용
+
+사용법:
+    python benchmarks/check_indexes.py [--no-create]
+"""
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from services import database
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--no-create', action='store_true', help='인덱스를 만들지 않고 현재 상태만 확인')
+    args = parser.parse_args()
+
+    if not args.no_create:
+        database.ensure_indexes()
+
+    failed = False
+    for name, stages in database.explain_queries().items():
+        ok = database.uses_index(stages)
+        failed |= not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {name:<28} {' <- '.join(stages)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+운영 서버 설정 (gunicorn)
+backend 디렉토리에서 실행: gunicorn --config gunicorn.conf.py app:app
+
+- 워커 프로세스마다 모델을 한 번 로드하고, TensorFlow 스레드 수를 CPU 코어 수 / 워커 수로 제한해서
+  워커끼리 코어를 두고 경쟁하지 않게 함
+- GUNICORN_PRELOAD=True이면 앱 코드를 fork 전에 한 번만 불러와서 워커 시작 시간과 메모리를 줄임.
+  TensorFlow/MediaPipe 런타임은 fork 이후에 스레드를 만들어야 안전하므로 모델 워밍업은 fork 이후 워커에서 실행
+- 마스터 프로세스에 SIGHUP을 보내면 새 워커를 띄운 뒤 기존 워커를 정상 종료 (모델 파일 교체 후 무중단 재시작)
+"""
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+# 앱보다 먼저 .env를 읽어야 아래 설정과 워커 환경 변수에 반영됨
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'))
+
+SERVER_MODE = os.getenv('SERVER_MODE', 'sync')
+CPU_COUNT = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+# 워커 수 기본값: 코어 2개당 1개 (워커 하나가 추론에 여러 코어를 사용하므로)
+workers = int(os.getenv('WEB_CONCURRENCY', str(max(1, CPU_COUNT // 2))))
+
+if SERVER_MODE == 'async':
+    worker_class = 'gevent'
+    worker_connections = int(os.getenv('ASYNC_MAX_CONNECTIONS', '10000'))
+else:
+    # WebSocket 연결도 스레드 하나를 사용하므로 스트리밍 연결 수를 고려해서 설정
+    worker_class = 'gthread'
+    threads = int(os.getenv('GUNICORN_THREADS', '16'))
+
+preload_app = os.getenv('GUNICORN_PRELOAD', 'False').lower() == 'true'
+# 모델 로드와 워밍업이 끝날 때까지 워커가 응답하지 않으므로 넉넉하게 설정
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+# 재시작/종료 시 처리 중인 요청을 마칠 때까지 기다리는 시간(초)
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = 5
+# 메모리 누수 대비 워커 주기적 재시작 (0이면 사용하지 않음)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
+
+# 워커당 TensorFlow 스레드 수. 워커 프로세스가 상속하도록 앱을 불러오기 전에 환경 변수로 설정
+# (.env나 실행 환경에서 직접 지정한 값이 있으면 그 값을 사용)
+TF_THREADS_PER_WORKER = max(1, CPU_COUNT // workers)
+os.environ.setdefault('TF_NUM_INTRAOP_THREADS', str(TF_THREADS_PER_WORKER))
+os.environ.setdefault('TF_NUM_INTEROP_THREADS', '2')
+os.environ.setdefault('OMP_NUM_THREADS', str(TF_THREADS_PER_WORKER))
+# 수어 인식 실행 풀도 워커에 할당된 코어 수에 맞춤
+os.environ.setdefault('INFERENCE_WORKERS', str(max(2, TF_THREADS_PER_WORKER)))
+
+# preload 시 마스터 프로세스에서는 모델을 로드하지 않고 fork 이후 각 워커에서 워밍업
+WARMUP_AFTER_FORK = preload_app and os.getenv('MODEL_PRELOAD', 'True').lower() == 'true'
+if preload_app:
+    os.environ['MODEL_PRELOAD'] = 'False'
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        # 워커에서 앱을 불러올 때 모델 로드와 워밍업이 실행됨
+        return
+
+    import app as application
+    from services import database
+
+    # 마스터에서 만든 MongoDB 클라이언트(인덱스 생성 시 연결됨)는 fork 이후 사용할 수 없으므로 새로 만듦
+    database.close_client()
+    database.init_client()
+
+    if WARMUP_AFTER_FORK:
+        application.model_registry.warmup()
+    server.log.info("워커 %s 준비 완료", worker.pid)
+
+
+def worker_exit(server, worker):
+    from services import database
+    database.close_client()
@@ -5,11 +5,11 @@ import tensorflow as tf
 
 try:
     import dataset_prepare as dp
-    import data_augmentation as da
+    import input_pipeline as ip
 except ImportError:
     # 현재 디렉토리에서 import 시도
     from . import dataset_prepare as dp
-    from . import data_augmentation as da
+    from . import input_pipeline as ip
 
 def build_sign_language_model(num_classes=5, seq_len=30, ylen=67, xlen=120):
     """
@@ -66,86 +66,64 @@ def build_sign_language_model(num_classes=5, seq_len=30, ylen=67, xlen=120):
 
 # 학습 데이터가 있는 경우에 실행되는 코드
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="수어 이미지 시퀀스 분류 모델 학습")
+    parser.add_argument("--types", nargs="+", default=["단어"], help="학습에 사용할 수어 타입 (단어/문장/숫자)")
+    parser.add_argument("--seq-len", type=int, default=None,
+                        help="시퀀스 길이 (기본값: 가장 긴 시퀀스 길이, 문장을 포함하면 필수)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=30)
+    args = parser.parse_args()
+    # 문장은 단어보다 훨씬 길어서, 가장 긴 시퀀스에 맞추면 모든 단어 샘플이 문장 길이로 패딩됨
+    if "문장" in args.types and args.seq_len is None:
+        parser.error("문장 타입을 포함하면 --seq-len을 지정해야 합니다.")
+
     try:
         print("데이터셋 로딩 중...")
-        # 어노테이션 파일 로드 시도
-        annotation_path = "수어_데이터셋_어노테이션.xlsx"
+        xlen, ylen = 120, 67
         try:
-            dataset_annotation = pd.read_excel(annotation_path)
-            # 메모리 문제 해결 후에 삭제할 부분
-            dataset_annotation.loc[(dataset_annotation["한국어"].map(type) == int), "타입(단어/문장)"] = "숫자"
-
-            dataset_annotation = dataset_annotation[dataset_annotation["타입(단어/문장)"] != "문장"]
-            dataset_annotation = dataset_annotation[dataset_annotation["타입(단어/문장)"] != "숫자"]
-            print(f"어노테이션 데이터 로드 완료: {len(dataset_annotation)}개")
-
-            unique = dataset_annotation["한국어"].unique()
-            print(f"고유 단어 수: {unique.shape[0]}")
+            # 전처리된 uint8 캐시(메모리 맵) 사용. 원본 데이터가 바뀌었을 때만 다시 만듦
+            dataset = dp.load_dataset_cache(xlen=xlen, ylen=ylen)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"데이터셋 캐시 사용 불가: {str(e)}")
+            X, y, _ = dp.read_ai(xlen=xlen, ylen=ylen)
+            dataset = dp.DatasetCache.from_sequences(X, y)
+            del X
 
-            unique_idx_dict = dict(zip(unique, range(len(unique))))
-            print("단어-인덱스 사전 생성 완료")
-        except Exception as e:
-            print(f"어노테이션 파일 로드 실패: {str(e)}")
-            print("더미 단어 사전 생성")
-            unique = ["안녕하세요", "감사합니다", "반갑습니다", "도와주세요", "이해했습니다"]
-            unique_idx_dict = dict(zip(unique, range(len(unique))))
-            
-        # 데이터 로드
-        print("이미지 데이터 로드 중...")
         try:
-            xlen, ylen = 120, 67
-            X, y, seq_len = dp.read_ai(xlen=xlen, ylen=ylen)
-            print(f"이미지 데이터 로드 완료: {len(X)}개")
+            # 시퀀스는 학습 중에 tf.data 파이프라인이 디스크에서 필요한 만큼만 읽으므로 문장/숫자도 함께 학습할 수 있음
+            indices = dataset.select(args.types)
+            labels = dataset.labels[indices]
+            print(f"이미지 데이터 로드 완료: {len(indices)}개")
 
-            # 라벨 매핑
-            if isinstance(y[0], str):
-                y = [unique_idx_dict.get(label, 0) for label in y]
-            y = np.array(y)
+            # 라벨 매핑 (데이터셋에 나온 순서대로 번호 부여)
+            unique = [str(label) for label in pd.unique(labels)]
+            unique_idx_dict = dict(zip(unique, range(len(unique))))
+            print(f"고유 단어 수: {len(unique)}")
+            y = np.array([unique_idx_dict[str(label)] for label in labels])
 
-            for i in range(len(X)):
-                X[i] = X[i].reshape(-1, *(X[i].shape))
-                X[i] = X[i].astype(np.float32)
+            seq_len = args.seq_len or int(dataset.lengths[indices].max())
+            print(f"시퀀스 길이: {seq_len}")
 
-            X = np.concatenate(X, axis = 0)
-            print(f"이미지 데이터 변환 완료: {X.shape}")
-            
-            # 검증셋 분리
+            # 검증셋 분리 (이미지 대신 시퀀스 인덱스를 나눔)
             print("데이터셋 분할 중...")
-            X_train, y_train, X_valid, y_valid = dp.train_test_split(X, y, category=len(unique))
+            train_idx, y_train, valid_idx, y_valid = dp.train_test_split(indices, y, category=len(unique))
             print("데이터셋 분할 완료")
-            
-            # 메모리 정리
-            del X
-            del y
-            X_train_len = X_train.shape[0]
-
-            # data augmentation 작업
-            print("데이터 증강 중...")
-            # translate -> rotate -> Gaussian Noise
-            X_train_cat1 = da.apply_data_augmentation(X_train, [1, 2, 3])
-            X_train = np.concatenate([X_train, X_train_cat1], axis=0)
-            del X_train_cat1
-
-            # zoom -> rotate -> Gaussian Noise
-            X_train_cat2 = da.apply_data_augmentation(X_train[:X_train_len], [5, 2, 3])
-            X_train = np.concatenate([X_train, X_train_cat2], axis=0)
-            del X_train_cat2
-
-            y_train = np.concatenate([y_train, y_train, y_train])
-            print("데이터 증강 완료")
 
-            # 라벨 원-핫 인코딩
-            y_valid_onehot = tf.keras.utils.to_categorical(y_valid, len(unique))
-            y_train_onehot = tf.keras.utils.to_categorical(y_train, len(unique))
+            # data augmentation은 학습 중에 파이프라인에서 적용
+            # 원본 / translate -> rotate -> Gaussian Noise / zoom -> rotate -> Gaussian Noise
+            train_ds = ip.make_dataset(dataset, train_idx, y_train, len(unique), seq_len, batch_size=args.batch_size)
+            valid_ds = ip.make_dataset(dataset, valid_idx, y_valid, len(unique), seq_len, batch_size=args.batch_size,
+                                       augmentations=ip.NO_AUGMENTATION, shuffle=False)
 
             # 모델 생성
             print("모델 구축 중...")
-            model = build_sign_language_model(num_classes=len(unique), seq_len=seq_len)
+            model = build_sign_language_model(num_classes=len(unique), seq_len=seq_len, ylen=ylen, xlen=xlen)
             model.summary()
 
             # 모델 학습
             print("모델 학습 중...")
-            history = model.fit(X_train, y_train_onehot, batch_size=32, epochs=30, verbose=1, validation_data=(X_valid, y_valid_onehot))
+            history = model.fit(train_ds, epochs=args.epochs, verbose=1, validation_data=valid_ds)
 
             # 모델 저장
             print("모델 저장 중...")
@@ -160,7 +138,7 @@ if __name__ == "__main__":
             # 모델 평가
             print("모델 평가 중...")
             from sklearn.metrics import confusion_matrix
-            predictions = model.predict(X_valid)
+            predictions = model.predict(valid_ds)
             predictions = np.argmax(predictions, axis=1)
             conf_mat = confusion_matrix(y_valid, predictions)
             print("혼동 행렬:")
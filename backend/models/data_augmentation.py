@@ -160,7 +160,7 @@ def clipped_zoom(img, zoom_factor, **kwargs):
     y2, x2 = y1 + h, x1 + w
     bbox = np.array([y1, x1, y2, x2])
     # 다시 원래 배열의 좌표로 변환
-    bbox = (bbox / zoom_factor).astype(np.int)
+    bbox = (bbox / zoom_factor).astype(int)
     y1, x1, y2, x2 = bbox
     cropped_img = img[y1:y2, x1:x2]
 
@@ -175,64 +175,174 @@ def clipped_zoom(img, zoom_factor, **kwargs):
     return img
 
 
-def apply_data_augmentation(img_seq, process):
+def _warp_frames(seq, warp, out):
+    """
+    시퀀스마다 한 번 계산한 변환(warp)을 모든 프레임에 적용해서 미리 할당된 out에 바로 씀
+    :param seq: (프레임 수, h, w, 채널) 배열. out과 메모리가 겹치면 안 됨
+    :param warp: (입력 이미지, 출력 배열)을 받는 cv2 호출. 출력 배열에 쓸 수 없으면 새 배열을 반환
+    :param out: (프레임 수, 출력 h, 출력 w, 채널) 배열
+    """
+    for j in range(seq.shape[0]):
+        frame = out[j]
+        # 연속된 메모리가 아니면 cv2가 dst에 쓰지 않고 새 배열을 반환하므로 복사
+        result = warp(seq[j], frame if frame.flags.c_contiguous else None)
+        if result is not frame:
+            frame[...] = result
+    return out
+
+
+def translate_sequence(seq, shift, direction):
+    """
+    translate(roll=False)를 시퀀스의 모든 프레임에 한 번에 적용 (제자리에서 변경)
+    :param seq: (프레임 수, h, w, 채널) 배열
+    """
+    assert direction in ['right', 'left', 'down', 'up'], "Directions should be top|up|left|right"
+    # 겹치는 영역끼리 대입해도 numpy가 임시 버퍼를 사용하므로 결과가 같음
+    if direction == 'right':
+        seq[:, :, shift:] = seq[:, :, :-shift]
+        seq[:, :, :shift] = seq[:, :, shift:shift + 1]
+    elif direction == 'left':
+        seq[:, :, :-shift] = seq[:, :, shift:]
+        seq[:, :, -shift:] = seq[:, :, -(shift + 1):-shift]
+    elif direction == 'down':
+        seq[:, shift:] = seq[:, :-shift]
+        seq[:, :shift] = seq[:, shift:shift + 1]
+    else:
+        seq[:, :-shift] = seq[:, shift:]
+        seq[:, -shift:] = seq[:, -(shift + 1):-shift]
+    return seq
+
+
+def rotate_sequence(seq, angle, out=None, bg_patch=(10, 10)):
+    """
+    rotate_img를 시퀀스의 모든 프레임에 적용. 회전 행렬은 시퀀스마다 한 번만 계산
+    rotate_img(scipy의 3차 스플라인)와 달리 cv2의 양선형 보간을 사용하므로 픽셀 값이 조금 다를 수 있음
+    :param out: 결과를 쓸 배열. seq와 메모리가 겹치면 안 됨. 없으면 새로 할당
+    """
+    if out is None:
+        out = np.empty_like(seq)
+    h, w = seq.shape[1:3]
+    # 프레임마다 왼쪽 위 가장자리의 평균 색 (회전 전에 계산)
+    bg_color = seq[:, :bg_patch[0], :bg_patch[1], :].mean(axis=(1, 2))
+    # scipy rotate와 같은 방향으로, 출력 좌표를 이미지 중심 기준으로 회전시켜 입력 좌표를 구하는 행렬
+    c, s = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+    cy, cx = (h - 1) / 2, (w - 1) / 2
+    matrix = np.array([[c, -s, cx - c * cx + s * cy],
+                       [s, c, cy - s * cx - c * cy]])
+    _warp_frames(seq, lambda img, dst: cv2.warpAffine(img, matrix, (w, h), dst=dst,
+                                                       flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                                                       borderMode=cv2.BORDER_CONSTANT, borderValue=0), out)
+    # 회전 후 비어 있는 부분(값이 0 이하인 채널이 있는 픽셀)을 배경색으로 채움
+    mask = np.any(out <= 0, axis=-1, keepdims=True)
+    np.copyto(out, bg_color[:, np.newaxis, np.newaxis, :].astype(out.dtype), where=mask)
+    return out
+
+
+def zoom_sequence(seq, zoom_factor, out=None):
+    """
+    clipped_zoom을 시퀀스의 모든 프레임에 적용. 자를 영역은 시퀀스마다 한 번만 계산
+    :param out: 결과를 쓸 배열. seq와 메모리가 겹치면 안 됨. 없으면 새로 할당
+    """
+    if out is None:
+        out = np.empty_like(seq)
+    h, w = seq.shape[1:3]
+    new_h, new_w = int(h * zoom_factor), int(w * zoom_factor)
+    y1, x1 = max(0, new_h - h) // 2, max(0, new_w - w) // 2
+    bbox = (np.array([y1, x1, y1 + h, x1 + w]) / zoom_factor).astype(int)
+    y1, x1, y2, x2 = bbox
+
+    resize_h, resize_w = min(new_h, h), min(new_w, w)
+    pad_h1, pad_w1 = (h - resize_h) // 2, (w - resize_w) // 2
+    _warp_frames(seq[:, y1:y2, x1:x2], lambda img, dst: cv2.resize(img, (resize_w, resize_h), dst=dst),
+                 out[:, pad_h1:pad_h1 + resize_h, pad_w1:pad_w1 + resize_w])
+
+    # 축소한 경우 가장자리 픽셀로 채움 (np.pad의 edge 모드)
+    if resize_h < h or resize_w < w:
+        out[:, :pad_h1] = out[:, pad_h1:pad_h1 + 1]
+        out[:, pad_h1 + resize_h:] = out[:, pad_h1 + resize_h - 1:pad_h1 + resize_h]
+        out[:, :, :pad_w1] = out[:, :, pad_w1:pad_w1 + 1]
+        out[:, :, pad_w1 + resize_w:] = out[:, :, pad_w1 + resize_w - 1:pad_w1 + resize_w]
+    return out
+
+
+def channel_ratio_sequence(seq, **kwargs):
+    """
+    change_channel_ratio를 시퀀스의 모든 프레임에 한 번에 적용 (제자리에서 변경)
+    """
+    for color, ratio in kwargs.items():
+        assert color in ['r', 'g', 'b'], "Color should be r|g|b"
+        assert ratio <= 1, "Ratio should be less than 1."
+        seq[..., 'rgb'.index(color)] *= ratio
+    return seq
+
+
+def gaussian_noise_sequence(seq, mean=0, sigma=0.03):
+    """
+    gaussian_noise와 같은 노이즈를 제자리에서 적용. 노이즈를 프레임 수만큼 복제하지 않고 브로드캐스팅
+    """
+    # zero-padding 이미지 수를 탐색
+    nonzero = np.flatnonzero(seq.reshape(seq.shape[0], -1).sum(axis=1) != 0)
+    start = nonzero[0] if len(nonzero) else 0
+    noise = np.random.normal(mean, sigma, seq.shape[1:])
+    frames = seq[start:]
+    noisy = frames + noise
+    # 1을 넘는 픽셀은 남은 거리의 절반만큼만, 0보다 작아지는 픽셀은 노이즈를 더하지 않음
+    np.copyto(noisy, frames + (1.0 - frames) * 0.5, where=noisy >= 1.0)
+    np.copyto(noisy, frames, where=noisy < 0)
+    frames[...] = noisy
+    return seq
+
+
+def apply_data_augmentation(img_seq, process, out=None):
     """
     :param process: 처리할 항목 리스트 - 1: translate / 2: rotate / 3: gaussian / 4: channel ratio / 5: zoom
     처리할 항목을 받으면 순차적으로 이미지에 변형본 적용
+    변형은 시퀀스 단위로 모든 프레임에 한 번에 적용하고, 랜덤값은 기존과 같은 순서로 뽑음
+    :param out: 결과를 쓸 배열. 없으면 새로 할당하고, img_seq를 넘기면 제자리에서 변경
     :return:
     """
-    img_seq = img_seq.copy()
+    if out is None:
+        out = img_seq.copy()
+    elif out is not img_seq:
+        np.copyto(out, img_seq)
+    # 회전/확대는 원본 픽셀을 다시 읽어야 하므로 시퀀스 하나 크기의 임시 배열을 한 번만 할당해서 재사용
+    scratch = np.empty_like(out[0]) if len(out) else None
     for type in process:
         if type == 1: # Translation
-            for i in range(img_seq.shape[0]):
+            for i in range(out.shape[0]):
                 # 방향과 이동할 픽셀 값을 랜덤값으로 전달 받아서 각 데이터에 적용
-                temp = img_seq[i]
                 direction = np.random.choice(["right", "left", "down", "up"], size=1)[0]
                 shift = np.random.randint(10, 20, size=1)[0]
-                for j in range(temp.shape[0]):
-                    temp[j] = translate(temp[j], shift=shift, direction=direction)
-                img_seq[i] = temp
+                translate_sequence(out[i], shift=shift, direction=direction)
 
         elif type == 2: # Rotate
-            for i in range(img_seq.shape[0]):
+            for i in range(out.shape[0]):
                 # 이미지를 회전시킬 정도를 랜덤값으로 전달 받아서 각 데이터에 적용
-                temp = img_seq[i]
                 angle = np.random.randint(-20, 21, size=1)[0]
-                for j in range(temp.shape[0]):
-                    temp[j] = rotate_img(temp[j], angle=angle)
-                img_seq[i] = temp
+                np.copyto(scratch, out[i])
+                rotate_sequence(scratch, angle=angle, out=out[i])
 
         elif type == 3: # Gaussian Noise
-            for i in range(img_seq.shape[0]):
+            for i in range(out.shape[0]):
                 # 노이즈를 생성할 가우시안 분포의 파라미터를 랜덤값으로 받아서 각 데이터에 적용
                 mean = np.random.uniform(0, 0.5, size=1)[0]
                 std = np.random.uniform(0.01, 0.1, size=1)[0]
-                img_seq[i] = gaussian_noise(img_seq[i], mean=mean, sigma=std)
+                gaussian_noise_sequence(out[i], mean=mean, sigma=std)
 
         elif type == 4: # Channel Ratio
-            for i in range(img_seq.shape[0]):
+            for i in range(out.shape[0]):
                 # 변경할 채널과 비율을 랜덤값으로 전달 받아서 각 데이터에 적용
-                temp = img_seq[i]
                 color = np.random.choice(["r", "g", "b"], size=1, replace=False)[0]
                 ratio = np.random.uniform(0, 1, size=1)[0]
-                for j in range(temp.shape[0]):
-                    if color == "r":
-                        temp[j] = change_channel_ratio(temp[j], r=ratio)
-                    elif color == "g":
-                        temp[j] = change_channel_ratio(temp[j], g=ratio)
-                    else:
-                        temp[j] = change_channel_ratio(temp[j], b=ratio)
-                img_seq[i] = temp
+                channel_ratio_sequence(out[i], **{color: ratio})
 
         elif type == 5: # Zoom
-            for i in range(img_seq.shape[0]):
+            for i in range(out.shape[0]):
                 # 이미지를 확대시킬 비율을 랜덤값으로 전달 받아서 각 데이터에 적용
-                temp = img_seq[i]
                 ratio = np.random.uniform(1.0, 1.5, size=1)[0]
-                for j in range(temp.shape[0]):
-                    temp[j] = clipped_zoom(temp[j], zoom_factor=ratio)
-                img_seq[i] = temp
-    return img_seq
+                np.copyto(scratch, out[i])
+                zoom_sequence(scratch, zoom_factor=ratio, out=out[i])
+    return out
 
 
 # 테스트 코드는 if __name__ == "__main__" 블록 안에 포함
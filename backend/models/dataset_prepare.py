@@ -1,4 +1,7 @@
 import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from PIL import Image
@@ -26,101 +29,243 @@ def zero_padding_4d(img_seq, max_len):
     return img_seq
 
 
-def read_ai(xlen=120, ylen=67, data_path=None, annotation_path=None):
+# 전처리된 데이터셋 캐시를 저장하는 기본 디렉토리
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset_cache")
+
+# read_ai에서 제외하는 수어 타입 (모든 시퀀스를 메모리에 올리므로 길이가 긴 문장과 숫자는 제외)
+EXCLUDED_TYPES = ("문장", "숫자")
+
+# 더미 데이터 단어 목록 (데이터가 없을 때 사용)
+DUMMY_WORDS = ["안녕하세요", "감사합니다", "반갑습니다", "도와주세요", "이해했습니다"]
+
+
+def default_paths(data_path=None, annotation_path=None):
     """
-    :param xlen, ylen: 이미지를 원하는 크기로 읽어들이는 것
-    :param data_path: 데이터 폴더 경로
-    :param annotation_path: 어노테이션 파일 경로
-    :returns input, output data(리스트 타입) / max_len 이미지 시퀸스의 길이
+    데이터 폴더와 어노테이션 파일 기본 경로 - models 디렉토리의 상위 디렉토리에 data 폴더
     """
-    # 데이터 경로 설정 - 기본값은 models 디렉토리의 상위 디렉토리에 data 폴더
     if data_path is None:
         data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "sign_data")
-    
-    # 어노테이션 파일 경로 설정
     if annotation_path is None:
         annotation_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "수어_데이터셋_어노테이션.xlsx")
+    return data_path, annotation_path
+
+
+def load_annotation(annotation_path):
+    """
+    어노테이션 파일을 읽고 숫자 타입과 폴더 이름 열을 추가
+    """
+    dataset_annotation = pd.read_excel(annotation_path)
+    dataset_annotation.loc[(dataset_annotation["한국어"].map(type) == int), "타입(단어/문장)"] = "숫자"
+    dataset_annotation["folder_name"] = dataset_annotation["파일명"].str[:-4]
+    return dataset_annotation
+
+
+def build_annotation_index(dataset_annotation):
+    """
+    폴더 이름 -> (라벨, 타입) 사전. 같은 폴더가 여러 번 있으면 첫 번째 행을 사용
+    폴더마다 DataFrame 전체를 필터링하지 않고 한 번의 사전 조회로 라벨과 타입을 찾기 위함
+    """
+    annotation_index = {}
+    for folder_name, label, sign_type in zip(dataset_annotation["folder_name"], dataset_annotation["한국어"],
+                                             dataset_annotation["타입(단어/문장)"]):
+        if type(label) == int:
+            label = str(label)
+        annotation_index.setdefault(folder_name, (label, sign_type))
+    return annotation_index
+
+
+def load_annotation_index(annotation_path, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    어노테이션 인덱스를 반환. .xlsx 파싱이 느리므로 한 번 만든 인덱스는 pickle로 저장해 두고,
+    어노테이션 파일의 수정 시각과 크기가 같으면 저장된 인덱스를 사용
+    :param cache_dir: 인덱스를 저장할 디렉토리. None이면 저장하지 않고 매번 파싱
+    """
+    if cache_dir is None:
+        return build_annotation_index(load_annotation(annotation_path))
+
+    stat = os.stat(annotation_path)
+    source = (os.path.abspath(annotation_path), stat.st_mtime, stat.st_size)
+    cache_path = os.path.join(cache_dir, "annotation_index.pickle")
+    try:
+        with open(cache_path, "rb") as file:
+            cached = pickle.load(file)
+        if cached["source"] == source:
+            return cached["index"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        pass
+
+    annotation_index = build_annotation_index(load_annotation(annotation_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        pickle.dump({"source": source, "index": annotation_index}, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return annotation_index
+
+
+def scan_dataset(data_path, annotation_index, exclude_types=EXCLUDED_TYPES):
+    """
+    데이터 폴더를 훑어서 학습에 사용할 이미지 시퀀스 목록을 만듦 (이미지는 읽지 않음)
+    :param annotation_index: load_annotation_index로 만든 폴더 이름 -> (라벨, 타입) 사전
+    :param exclude_types: 제외할 수어 타입
+    :return: [(폴더 이름, 라벨, 정렬된 이미지 경로 리스트), ...]
+    """
+    folder_list = os.listdir(data_path)
+    items = []
+    for folder_name in folder_list:
+        img_path = os.path.join(data_path, folder_name)
+        # 각 폴더에는 해당하는 이미지들이 저장되어 있기 때문에, 폴더에 접근해서 이미지들을 순차적으로 읽어들임
+        if not os.path.isdir(img_path):
+            continue
+
+        # 해당 폴더에 대한 어노테이션이 없는 경우 건너뛰기
+        annotation = annotation_index.get(folder_name)
+        if annotation is None:
+            continue
+
+        # 메모리 문제 때문에 해당 수어가 문장 또는 숫자인 경우 제외
+        label, sign_type = annotation
+        if sign_type in exclude_types:
+            continue
+
+        img_list = os.listdir(img_path)
+        img_list.sort()
+        items.append((folder_name, label, [os.path.join(img_path, name) for name in img_list]))
+    return items
+
+
+def load_sequence(image_paths, xlen, ylen, dtype=np.float32, out=None):
+    """
+    이미지 시퀀스 하나를 읽어서 (xlen, ylen) 크기로 변경
+    :param dtype: 결과 배열 타입. np.uint8이면 원본 픽셀 타입 그대로 리사이즈해서 메모리를 1/4로 줄임
+    :param out: 결과를 쓸 (len(image_paths), ylen, xlen, 3) 배열. 없으면 새로 할당
+    :return: 읽은 프레임 수만큼의 (n, ylen, xlen, 3) 배열 (읽지 못한 이미지는 건너뜀)
+    """
+    if out is None:
+        out = np.empty((len(image_paths), ylen, xlen, 3), dtype=dtype)
+    n = 0
+    for image_path in image_paths:
+        try:
+            image = Image.open(image_path)
+            image = np.asarray(image, dtype=dtype)
+            # 이미지를 함수 호출자가 원하는 크기로 변경
+            out[n] = cv2.resize(image, dsize=(xlen, ylen))
+            n += 1
+        except Exception as e:
+            print(f"Warning: 이미지 {image_path} 처리 중 오류 발생: {str(e)}")
+            continue
+    return out[:n]
+
+
+def _load_item(args):
+    """
+    프로세스 풀 워커에서 실행
+    """
+    image_paths, xlen, ylen, dtype = args
+    return load_sequence(image_paths, xlen, ylen, dtype=dtype)
+
+
+class ProgressReport:
+    """
+    데이터셋 로딩 진행 상황과 처리량(초당 시퀀스/프레임 수) 출력
+    """
+
+    def __init__(self, total, every=100):
+        self.total = total
+        self.every = every
+        self.sequences = 0
+        self.frames = 0
+        self.start = time.perf_counter()
+
+    def update(self, frames):
+        self.sequences += 1
+        self.frames += frames
+        if self.sequences % self.every == 0 or self.sequences == self.total:
+            elapsed = max(time.perf_counter() - self.start, 1e-9)
+            print(f"[{self.sequences}/{self.total}] 시퀀스 {self.sequences / elapsed:.1f}개/s, "
+                  f"프레임 {self.frames / elapsed:.1f}개/s ({elapsed:.1f}초)")
+
+
+def load_sequences(items, xlen, ylen, workers=None, every=100, dtype=np.uint8):
+    """
+    scan_dataset의 시퀀스들을 프로세스 풀에서 병렬로 읽어서 순서대로 반환하는 제너레이터
+    이미지 디코딩과 리사이즈는 CPU 작업이라 GIL 때문에 스레드로는 빨라지지 않으므로 프로세스를 사용
+    :param workers: 프로세스 수. 없으면 CPU 코어 수, 1이면 현재 프로세스에서 순차적으로 읽음
+    :param dtype: 리사이즈할 때의 배열 타입. uint8이면 프로세스 간에 보내는 데이터가 float32의 1/4이지만
+                  보간된 픽셀 값이 정수로 반올림되므로, float32 결과와 같아야 하면 np.float32를 사용
+    :return: (폴더 이름, 라벨, (n, ylen, xlen, 3) 배열)을 items 순서대로 생성
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    progress = ProgressReport(len(items), every)
+    jobs = ((image_paths, xlen, ylen, dtype) for _, _, image_paths in items)
+    if workers <= 1 or len(items) <= 1:
+        results = map(_load_item, jobs)
+        for (folder_name, label, _), img_seq in zip(items, results):
+            progress.update(len(img_seq))
+            yield folder_name, label, img_seq
+        return
+
+    # 작은 작업을 여러 개씩 묶어서 보내 프로세스 간 통신 비용을 줄임
+    chunksize = max(1, min(16, len(items) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map은 제출한 순서대로 결과를 반환하므로 폴더 순서가 유지됨
+        results = executor.map(_load_item, jobs, chunksize=chunksize)
+        for (folder_name, label, _), img_seq in zip(items, results):
+            progress.update(len(img_seq))
+            yield folder_name, label, img_seq
+
+
+def dummy_dataset(xlen, ylen):
+    dummy_input = [np.zeros((5, ylen, xlen, 3)) for _ in range(5)]
+    return dummy_input, list(DUMMY_WORDS), 5
+
+
+def read_ai(xlen=120, ylen=67, data_path=None, annotation_path=None, workers=None):
+    """
+    :param xlen, ylen: 이미지를 원하는 크기로 읽어들이는 것
+    :param data_path: 데이터 폴더 경로
+    :param annotation_path: 어노테이션 파일 경로
+    :param workers: 이미지를 읽을 프로세스 수 (없으면 CPU 코어 수)
+    :returns input, output data(리스트 타입) / max_len 이미지 시퀸스의 길이
+    """
+    data_path, annotation_path = default_paths(data_path, annotation_path)
     
     # 데이터 폴더나 어노테이션 파일이 없는 경우 기본 값 반환
     if not os.path.exists(data_path) or not os.path.exists(annotation_path):
         print(f"Warning: 데이터 폴더({data_path}) 또는 어노테이션 파일({annotation_path})이 존재하지 않습니다.")
         print("5개의 기본 단어에 대한 더미 데이터를 생성합니다.")
         # 더미 데이터 생성
-        dummy_input = [np.zeros((5, ylen, xlen, 3)) for _ in range(5)]
-        dummy_output = ["안녕하세요", "감사합니다", "반갑습니다", "도와주세요", "이해했습니다"]
-        return dummy_input, dummy_output, 5
+        return dummy_dataset(xlen, ylen)
     
     # 각 이미지 시퀀스는 폴더에 저장되어 있음. 각 폴더가 하나의 데이터
     try:
-        folder_list = os.listdir(data_path)
-        
-        dataset_annotation = pd.read_excel(annotation_path)
-        dataset_annotation.loc[(dataset_annotation["한국어"].map(type) == int), "타입(단어/문장)"] = "숫자"
-        dataset_annotation["folder_name"] = dataset_annotation["파일명"].str[:-4]
+        items = scan_dataset(data_path, load_annotation_index(annotation_path))
 
         input_data = []
         output_data = []
         # 추후에 zero-padding을 위해 이미지 시퀸스의 가장 긴 길이를 체크 해야함
         img_max_len = 0
         
-        for i in range(len(folder_list)):
-            img_path = os.path.join(data_path, folder_list[i])
-            # 각 폴더에는 해당하는 이미지들이 저장되어 있기 때문에, 폴더에 접근해서 이미지들을 순차적으로 읽어들임
-            if not os.path.isdir(img_path):
-                continue
-                
-            img_list = os.listdir(img_path)
-            img_list.sort()
-            
-            # 해당 폴더에 대한 어노테이션이 없는 경우 건너뛰기
-            if dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].empty:
-                continue
-                
-            # 메모리 문제 때문에 해당 수어가 문장 또는 숫자인 경우 제외
-            if dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].iloc[0]["타입(단어/문장)"] == "문장":
-                continue
-            elif dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].iloc[0]["타입(단어/문장)"] == "숫자":
-                continue
-
-            if len(img_list) > img_max_len:
+        for _, _, image_paths in items:
+            if len(image_paths) > img_max_len:
                 # 이미지 시퀸스의 최대 길이를 갱신
-                img_max_len = len(img_list)
-                
-            # 폴더 안에 있는 이미지들을 읽어서 리스트에 저장
-            img_seq = []
-            for j in range(len(img_list)):
-                image_path = os.path.join(img_path, img_list[j])
-                try:
-                    image = Image.open(image_path)
-                    image = np.asarray(image, dtype=np.float32)
-                    # 이미지를 함수 호출자가 원하는 크기로 변경
-                    image = cv2.resize(image, dsize=(xlen, ylen))
-                    # 이미지 시퀸스를 만들기 위해 3차원 배열을 4차원 배열로 변환
-                    image = image.reshape(-1, *image.shape)
-                    img_seq.append(image)
-                except Exception as e:
-                    print(f"Warning: 이미지 {image_path} 처리 중 오류 발생: {str(e)}")
-                    continue
-                    
-            if not img_seq:
+                img_max_len = len(image_paths)
+
+        # 폴더 안에 있는 이미지들을 병렬로 읽어서 폴더마다 하나의 4차원 배열로 만듦
+        # 기존 결과와 같도록 float32로 리사이즈
+        for folder_name, label, img_seq in load_sequences(items, xlen, ylen, workers, dtype=np.float32):
+            if len(img_seq) == 0:
                 continue
                 
-            # img_seq 안에 있는 이미지를 모두 concatenate해서 하나의 4차원 배열로 만듦
-            img_seq = np.concatenate(img_seq)
             input_data.append(img_seq)
-            # print("Read {0} Complete".format(i))
-            label = dataset_annotation[dataset_annotation["folder_name"] == folder_list[i]].loc[:, "한국어"].values[0]
-            if type(label) == int:
-                label = str(label)
             # 이미지 시퀸스에 해당하는 한국어 추가
             output_data.append(label)
 
         if not input_data:
             print("Warning: 처리할 수 있는 데이터가 없습니다. 기본 더미 데이터를 생성합니다.")
             # 더미 데이터 생성
-            dummy_input = [np.zeros((5, ylen, xlen, 3)) for _ in range(5)]
-            dummy_output = ["안녕하세요", "감사합니다", "반갑습니다", "도와주세요", "이해했습니다"]
-            return dummy_input, dummy_output, 5
+            return dummy_dataset(xlen, ylen)
 
         for i in range(len(input_data)):
             # input_data를 zero-padding해서 모두 같은 길이로 만들어준다.
@@ -131,9 +276,189 @@ def read_ai(xlen=120, ylen=67, data_path=None, annotation_path=None):
     except Exception as e:
         print(f"Error: 데이터 로드 중 오류 발생: {str(e)}")
         # 오류 발생 시 더미 데이터 반환
-        dummy_input = [np.zeros((5, ylen, xlen, 3)) for _ in range(5)]
-        dummy_output = ["안녕하세요", "감사합니다", "반갑습니다", "도와주세요", "이해했습니다"]
-        return dummy_input, dummy_output, 5
+        return dummy_dataset(xlen, ylen)
+
+
+def source_mtime(data_path, annotation_path):
+    """
+    원본 데이터의 최종 수정 시각 (어노테이션 파일, 데이터 폴더, 각 시퀀스 폴더 중 가장 최근)
+    폴더에 이미지가 추가/삭제되면 폴더의 수정 시각이 바뀌므로 캐시를 다시 만들어야 하는지 판단할 수 있음
+    """
+    mtimes = [os.path.getmtime(annotation_path), os.path.getmtime(data_path)]
+    with os.scandir(data_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                mtimes.append(entry.stat().st_mtime)
+    return max(mtimes)
+
+
+class DatasetCache:
+    """
+    build_dataset_cache로 만든 전처리 데이터셋
+    모든 시퀀스의 프레임이 하나의 uint8 배열(메모리 맵)에 이어 붙어 있고, i번째 시퀀스는
+    frames[offsets[i]:offsets[i] + lengths[i]]. 필요한 시퀀스만 디스크에서 읽으므로 전체를 메모리에 올리지 않음
+    """
+
+    def __init__(self, frames, offsets, lengths, labels, folders, types=None):
+        self.frames = frames
+        self.offsets = offsets
+        self.lengths = lengths
+        self.labels = labels
+        self.folders = folders
+        self.types = types
+
+    @classmethod
+    def from_sequences(cls, sequences, labels, types=None):
+        """
+        메모리에 있는 시퀀스 리스트(read_ai의 결과 등)로 만듦
+        """
+        lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+        # float 시퀀스를 한꺼번에 이어 붙이면 float 복사본이 한 벌 더 생기므로 uint8 배열에 하나씩 변환해서 씀
+        # 0~255 밖의 값은 잘라내고 반올림해서 astype의 버림/순환 없이 저장
+        frames = np.empty((int(lengths.sum()), *np.shape(sequences[0])[1:]), dtype=np.uint8)
+        for seq, offset, length in zip(sequences, offsets, lengths):
+            frames[offset:offset + length] = np.clip(np.rint(seq), 0, 255).astype(np.uint8)
+        folders = np.array([str(i) for i in range(len(sequences))])
+        return cls(frames, offsets, lengths, np.array(labels), folders,
+                   np.array(types) if types is not None else None)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    @property
+    def max_len(self):
+        return int(self.lengths.max())
+
+    @property
+    def frame_shape(self):
+        return self.frames.shape[1:]
+
+    def select(self, types=None):
+        """
+        주어진 수어 타입의 시퀀스 인덱스. types가 없거나 타입 정보가 없으면 전체
+        """
+        if types is None or self.types is None:
+            return np.arange(len(self))
+        return np.flatnonzero(np.isin(self.types, list(types)))
+
+    def sequence(self, i, seq_len=None, out=None):
+        """
+        i번째 시퀀스를 seq_len 길이로 맞춰서 반환 (짧으면 앞쪽을 0으로 채우고, 길면 마지막 seq_len개 프레임만 사용)
+        :param seq_len: 시퀀스 길이. 없으면 가장 긴 시퀀스 길이(read_ai와 같음)
+        :param out: 결과를 쓸 (seq_len, *frame_shape) 배열. 없으면 새로 할당
+        """
+        if seq_len is None:
+            seq_len = self.max_len
+        if out is None:
+            out = np.empty((seq_len, *self.frame_shape), dtype=self.frames.dtype)
+        start, length = self.offsets[i], self.lengths[i]
+        n = min(length, seq_len)
+        out[:seq_len - n] = 0
+        out[seq_len - n:] = self.frames[start + length - n:start + length]
+        return out
+
+    def to_array(self, indices=None, seq_len=None, dtype=np.uint8):
+        """
+        여러 시퀀스를 (N, seq_len, ylen, xlen, 3) 배열 하나로 만듦. 결과 배열만 한 번 할당
+        """
+        if indices is None:
+            indices = range(len(self))
+        if seq_len is None:
+            seq_len = self.max_len
+        X = np.empty((len(indices), seq_len, *self.frame_shape), dtype=dtype)
+        buffer = np.empty((seq_len, *self.frame_shape), dtype=self.frames.dtype)
+        for n, i in enumerate(indices):
+            X[n] = self.sequence(i, seq_len, out=buffer)
+        return X
+
+
+def dataset_cache_paths(xlen, ylen, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    캐시 파일 경로 - 이미지 크기별로 따로 저장
+    :return: (프레임 배열 .npy 경로, 인덱스 .npz 경로)
+    """
+    name = f"ai_{xlen}x{ylen}"
+    return os.path.join(cache_dir, f"{name}.frames.npy"), os.path.join(cache_dir, f"{name}.index.npz")
+
+
+def build_dataset_cache(xlen=120, ylen=67, data_path=None, annotation_path=None, cache_dir=DEFAULT_CACHE_DIR,
+                        workers=None):
+    """
+    read_ai와 같은 방식으로 읽은 이미지를 uint8로 리사이즈해서 디스크의 메모리 맵 배열 하나에 저장
+    읽은 시퀀스를 순서대로 디스크 배열에 바로 쓰므로 데이터셋 전체를 메모리에 올리지 않음
+    메모리 제약이 없으므로 문장/숫자 타입도 모두 저장하고, 타입을 함께 저장해서 학습 시 선택
+    :param workers: 이미지를 읽을 프로세스 수 (없으면 CPU 코어 수)
+    :return: 인덱스 파일 경로
+    """
+    data_path, annotation_path = default_paths(data_path, annotation_path)
+    if not os.path.exists(data_path) or not os.path.exists(annotation_path):
+        raise FileNotFoundError(f"데이터 폴더({data_path}) 또는 어노테이션 파일({annotation_path})이 존재하지 않습니다.")
+
+    mtime = source_mtime(data_path, annotation_path)
+    annotation_index = load_annotation_index(annotation_path, cache_dir)
+    items = scan_dataset(data_path, annotation_index, exclude_types=())
+    if not items:
+        raise ValueError("처리할 수 있는 데이터가 없습니다.")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    frames_path, index_path = dataset_cache_paths(xlen, ylen, cache_dir)
+    tmp_frames_path = frames_path + ".tmp"
+    total = sum(len(image_paths) for _, _, image_paths in items)
+    frames = np.lib.format.open_memmap(tmp_frames_path, mode="w+", dtype=np.uint8, shape=(total, ylen, xlen, 3))
+
+    offsets, lengths, labels, folders, types = [], [], [], [], []
+    cursor = 0
+    for folder_name, label, seq in load_sequences(items, xlen, ylen, workers):
+        if len(seq) == 0:
+            continue
+        frames[cursor:cursor + len(seq)] = seq
+        offsets.append(cursor)
+        lengths.append(len(seq))
+        labels.append(label)
+        folders.append(folder_name)
+        types.append(annotation_index[folder_name][1])
+        cursor += len(seq)
+    frames.flush()
+    del frames
+    os.replace(tmp_frames_path, frames_path)
+
+    # 인덱스는 프레임 배열을 다 쓴 뒤에 저장하므로, 인덱스가 있으면 캐시가 완성된 것
+    np.savez(index_path,
+             offsets=np.array(offsets, dtype=np.int64),
+             lengths=np.array(lengths, dtype=np.int64),
+             labels=np.array(labels),
+             folders=np.array(folders),
+             types=np.array(types),
+             xlen=xlen, ylen=ylen, source_mtime=mtime)
+    print(f"데이터셋 캐시 저장 완료: {frames_path} ({len(lengths)}개 시퀀스, {cursor}개 프레임)")
+    return index_path
+
+
+def load_dataset_cache(xlen=120, ylen=67, data_path=None, annotation_path=None, cache_dir=DEFAULT_CACHE_DIR,
+                       rebuild=False, workers=None):
+    """
+    전처리 데이터셋 캐시를 메모리 맵으로 열어서 반환. 캐시가 없거나 원본 데이터가 바뀌었으면 새로 만듦
+    :return: DatasetCache
+    """
+    data_path, annotation_path = default_paths(data_path, annotation_path)
+    frames_path, index_path = dataset_cache_paths(xlen, ylen, cache_dir)
+
+    stale = rebuild or not os.path.exists(index_path) or not os.path.exists(frames_path)
+    if not stale:
+        with np.load(index_path) as index:
+            # 타입 정보가 없는 이전 형식의 캐시도 다시 만듦
+            if "types" not in index.files or int(index["xlen"]) != xlen or int(index["ylen"]) != ylen:
+                stale = True
+            elif os.path.exists(data_path) and os.path.exists(annotation_path):
+                stale = float(index["source_mtime"]) < source_mtime(data_path, annotation_path)
+    if stale:
+        print("데이터셋 캐시 생성 중...")
+        build_dataset_cache(xlen, ylen, data_path, annotation_path, cache_dir, workers)
+
+    with np.load(index_path) as index:
+        return DatasetCache(np.load(frames_path, mmap_mode="r"), index["offsets"], index["lengths"],
+                            index["labels"], index["folders"], index["types"])
 
 
 def train_test_split(data_X, data_y, category, num=5):
@@ -158,3 +483,16 @@ def train_test_split(data_X, data_y, category, num=5):
     data_X_test = data_X[test_idx, ...]; print(data_X_test.shape)
     data_X_train = np.delete(data_X, test_idx, axis=0); print(data_X_train.shape)
     return data_X_train, data_y_train, data_X_test, data_y_test
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="수어 이미지 데이터셋을 전처리해서 메모리 맵 캐시로 저장")
+    parser.add_argument("--data-path", default=None)
+    parser.add_argument("--annotation-path", default=None)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--xlen", type=int, default=120)
+    parser.add_argument("--ylen", type=int, default=67)
+    parser.add_argument("--workers", type=int, default=None, help="이미지를 읽을 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args()
+    build_dataset_cache(args.xlen, args.ylen, args.data_path, args.annotation_path, args.cache_dir, args.workers)
@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import pickle
+import argparse
+import numpy as np
+import tensorflow as tf
+
+try:
+    import dataset_prepare as dp
+except ImportError:
+    # 현재 디렉토리에서 import 시도
+    from . import dataset_prepare as dp
+
+
+def fit_sequence_length(img_seq, seq_len):
+    """
+    이미지 시퀀스를 모델의 시퀀스 길이에 맞춤
+    짧으면 앞쪽을 0으로 채우고, 길면 마지막 seq_len개 프레임만 사용
+    """
+    if img_seq.shape[0] >= seq_len:
+        return img_seq[-seq_len:]
+    return dp.zero_padding_4d(img_seq, seq_len)
+
+
+def load_dataset_split(seq_len, word_dict, xlen=120, ylen=67, data_path=None, annotation_path=None, seed=0):
+    """
+    read_ai로 데이터를 읽어서 모델 입력 형태로 맞춘 뒤 학습/검증 세트로 분리
+    검증 세트는 seed를 고정해서 Keras/TFLite 비교 시 같은 데이터를 사용
+    :return: X_train, y_train, X_valid, y_valid
+    """
+    X, y, _ = dp.read_ai(xlen=xlen, ylen=ylen, data_path=data_path, annotation_path=annotation_path)
+
+    # 단어 사전에 없는 라벨은 평가할 수 없으므로 제외
+    X = [fit_sequence_length(x, seq_len) for x, label in zip(X, y) if label in word_dict]
+    y = np.array([word_dict[label] for label in y if label in word_dict])
+    if len(X) == 0:
+        raise ValueError("단어 사전과 일치하는 데이터가 없습니다.")
+    X = np.stack(X).astype(np.float32)
+
+    np.random.seed(seed)
+    return dp.train_test_split(X, y, category=len(word_dict))
+
+
+def convert_to_tflite(model, quantization="dynamic", calibration_data=None, allow_select_ops=False):
+    """
+    Keras 모델을 TFLite 모델로 변환
+    :param quantization: none: float32 그대로 / dynamic: 가중치만 int8 / int8: 활성값까지 int8 (보정 데이터 필요)
+    :param calibration_data: int8 양자화 시 활성값 범위를 측정할 입력 배열
+    :param allow_select_ops: TFLite 기본 연산으로 변환되지 않는 연산을 TF 연산으로 실행하도록 허용
+    """
+    assert quantization in ["none", "dynamic", "int8"], "quantization should be none|dynamic|int8"
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+
+    if quantization != "none":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "int8":
+        assert calibration_data is not None, "int8 quantization needs calibration data"
+
+        def representative_dataset():
+            for sample in calibration_data:
+                yield [sample[np.newaxis].astype(np.float32)]
+
+        # 입출력은 float32로 유지해서 서버 코드는 그대로 사용
+        converter.representative_dataset = representative_dataset
+
+    if allow_select_ops:
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS,
+            tf.lite.OpsSet.SELECT_TF_OPS
+        ]
+    return converter.convert()
+
+
+def evaluate(predict_fn, X, y):
+    """
+    샘플 하나씩 추론해서 정확도와 지연 시간을 측정
+    """
+    latencies = []
+    predictions = []
+    for sample in X:
+        start = time.perf_counter()
+        prob = predict_fn(sample[np.newaxis])
+        latencies.append(time.perf_counter() - start)
+        predictions.append(int(np.argmax(prob[0])))
+    latencies = np.array(latencies) * 1000
+    predictions = np.array(predictions)
+    return {
+        "accuracy": float(np.mean(predictions == y)),
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p99_ms": float(np.percentile(latencies, 99)),
+        "latency_mean_ms": float(latencies.mean())
+    }, predictions
+
+
+def tflite_predict_fn(tflite_model):
+    interpreter = tf.lite.Interpreter(model_content=tflite_model)
+    interpreter.allocate_tensors()
+    input_detail = interpreter.get_input_details()[0]
+    output_detail = interpreter.get_output_details()[0]
+
+    def predict(batch):
+        interpreter.set_tensor(input_detail["index"], batch.astype(np.float32))
+        interpreter.invoke()
+        return interpreter.get_tensor(output_detail["index"])
+
+    return predict
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="학습된 .h5 모델을 TFLite 모델로 변환")
+    parser.add_argument("--model", default=os.path.join(base_dir, "sign_language_model.h5"))
+    parser.add_argument("--word-dict", default=os.path.join(base_dir, "word_dict.pickle"))
+    parser.add_argument("--output", default=os.path.join(base_dir, "sign_language_model.tflite"))
+    parser.add_argument("--quantization", default="dynamic", choices=["none", "dynamic", "int8"])
+    parser.add_argument("--calibration-samples", type=int, default=100)
+    parser.add_argument("--allow-select-ops", action="store_true")
+    parser.add_argument("--data-path", default=None)
+    parser.add_argument("--annotation-path", default=None)
+    parser.add_argument("--report", default=None, help="비교 결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    print("모델 로드 중...")
+    model = tf.keras.models.load_model(args.model)
+    with open(args.word_dict, "rb") as file:
+        word_dict = pickle.load(file)
+    seq_len, ylen, xlen = model.input_shape[1:4]
+
+    # 보정과 비교 평가에는 데이터셋이 필요. 데이터가 없으면 변환만 수행
+    X_train = X_valid = y_valid = None
+    try:
+        print("데이터셋 로딩 중...")
+        X_train, _, X_valid, y_valid = load_dataset_split(seq_len, word_dict, xlen=xlen, ylen=ylen,
+                                                          data_path=args.data_path,
+                                                          annotation_path=args.annotation_path)
+    except Exception as e:
+        print(f"데이터셋 로드 실패: {str(e)}")
+        if args.quantization == "int8":
+            raise
+
+    calibration_data = None
+    if X_train is not None:
+        calibration_data = X_train[np.random.permutation(len(X_train))[:args.calibration_samples]]
+
+    print(f"TFLite 변환 중... (양자화: {args.quantization})")
+    tflite_model = convert_to_tflite(model, args.quantization, calibration_data, args.allow_select_ops)
+    with open(args.output, "wb") as file:
+        file.write(tflite_model)
+    print(f"TFLite 모델 저장 완료: {args.output}")
+
+    report = {
+        "quantization": args.quantization,
+        "keras_size_bytes": os.path.getsize(args.model),
+        "tflite_size_bytes": len(tflite_model)
+    }
+    if X_valid is not None:
+        print("검증 세트로 Keras/TFLite 모델 비교 중...")
+        keras_result, keras_pred = evaluate(lambda x: model(x, training=False).numpy(), X_valid, y_valid)
+        tflite_result, tflite_pred = evaluate(tflite_predict_fn(tflite_model), X_valid, y_valid)
+        report["validation_samples"] = int(len(X_valid))
+        report["keras"] = keras_result
+        report["tflite"] = tflite_result
+        # 두 모델의 예측이 일치하는 비율
+        report["prediction_agreement"] = float(np.mean(keras_pred == tflite_pred))
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+        print(f"비교 결과 저장 완료: {args.report}")
@@ -0,0 +1,58 @@
+import numpy as np
+import tensorflow as tf
+
+try:
+    import data_augmentation as da
+except ImportError:
+    # 현재 디렉토리에서 import 시도
+    from . import data_augmentation as da
+
+# 각 학습 시퀀스를 원본 1번 + 증강 2번 사용 (기존 학습 코드의 원본/translate/zoom 세 벌과 같음)
+# 처리 번호는 data_augmentation.apply_data_augmentation의 process와 같음
+AUGMENTATIONS = ([], [1, 2, 3], [5, 2, 3])
+NO_AUGMENTATION = ([],)
+
+
+def make_dataset(dataset, indices, label_ids, num_classes, seq_len, batch_size=32, augmentations=AUGMENTATIONS,
+                 shuffle=True, seed=None):
+    """
+    DatasetCache에서 시퀀스를 필요할 때만 읽어서 증강하고 배치로 묶는 tf.data 파이프라인
+    증강본을 미리 만들어 두지 않으므로 메모리에는 prefetch 중인 배치만 올라감
+    :param dataset: dataset_prepare.DatasetCache (메모리 맵)
+    :param indices: 사용할 시퀀스 인덱스
+    :param label_ids: indices와 같은 순서의 클래스 번호
+    :param seq_len: 시퀀스 길이. 짧으면 앞쪽을 0으로 채우고, 길면 마지막 seq_len개 프레임만 사용
+    :param augmentations: 시퀀스마다 만들 변형 목록. 빈 리스트는 원본 그대로
+    :param shuffle: 에포크마다 순서를 섞을지 여부. 검증용은 False로 해서 순서를 유지
+    :return: (x: (batch, seq_len, ylen, xlen, 3) float32, y: 원-핫 라벨) 배치를 생성하는 tf.data.Dataset
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    label_ids = np.asarray(label_ids, dtype=np.int64)
+    count = len(augmentations)
+    # (시퀀스 인덱스, 라벨, 변형 번호) 조합. 한 에포크에 각 시퀀스가 변형 수만큼 나옴
+    seq_indices = np.repeat(indices, count)
+    seq_labels = np.repeat(label_ids, count)
+    variants = np.tile(np.arange(count), len(indices))
+
+    ds = tf.data.Dataset.from_tensor_slices((seq_indices, seq_labels, variants))
+    if shuffle:
+        # 원소가 인덱스뿐이라 전체를 섞어도 메모리 부담이 없음
+        ds = ds.shuffle(len(seq_indices), seed=seed, reshuffle_each_iteration=True)
+
+    def load(i, variant):
+        x = dataset.sequence(int(i), seq_len).astype(np.float32)
+        process = augmentations[int(variant)]
+        if process:
+            # 방금 만든 배열이므로 복사하지 않고 제자리에서 증강
+            batch = x[np.newaxis]
+            da.apply_data_augmentation(batch, process, out=batch)
+        return x
+
+    def load_and_augment(i, label, variant):
+        x = tf.numpy_function(load, [i, variant], tf.float32)
+        x.set_shape((seq_len, *dataset.frame_shape))
+        return x, tf.one_hot(label, num_classes)
+
+    # 디스크 읽기와 증강을 여러 스레드에서 병렬로 실행. 섞는 경우 순서를 지킬 필요가 없으므로 먼저 끝난 것부터 사용
+    ds = ds.map(load_and_augment, num_parallel_calls=tf.data.AUTOTUNE, deterministic=not shuffle)
+    return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
@@ -0,0 +1,130 @@
+import os
+import argparse
+import numpy as np
+import cv2
+import mediapipe as mp
+
+try:
+    from landmark_model import landmarks_to_vector, NUM_FEATURES
+    from dataset_prepare import load_annotation_index
+except ImportError:
+    # 현재 디렉토리에서 import 시도
+    from .landmark_model import landmarks_to_vector, NUM_FEATURES
+    from .dataset_prepare import load_annotation_index
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "landmark_cache.npz")
+
+
+def extract_landmarks(data_path=None, annotation_path=None, cache_path=DEFAULT_CACHE_PATH):
+    """
+    sign_data 폴더의 모든 이미지 시퀀스에 MediaPipe Hands를 한 번 실행해서 랜드마크를 캐시 파일로 저장
+    랜드마크는 데이터가 작으므로 문장/숫자 타입도 모두 포함하고, 타입은 함께 저장해서 학습 시 선택
+    :param data_path: 데이터 폴더 경로
+    :param annotation_path: 어노테이션 파일 경로
+    :param cache_path: 저장할 .npz 파일 경로
+    """
+    if data_path is None:
+        data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "sign_data")
+    if annotation_path is None:
+        annotation_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "수어_데이터셋_어노테이션.xlsx")
+
+    # 폴더 이름 -> (라벨, 타입) 사전. 같은 폴더가 여러 번 있으면 첫 번째 행을 사용
+    annotation_dict = load_annotation_index(annotation_path)
+
+    mp_hands = mp.solutions.hands
+    features, lengths, labels, types, folders = [], [], [], [], []
+    folder_list = sorted(os.listdir(data_path))
+    for i, folder_name in enumerate(folder_list):
+        img_path = os.path.join(data_path, folder_name)
+        if not os.path.isdir(img_path) or folder_name not in annotation_dict:
+            continue
+
+        img_list = sorted(os.listdir(img_path))
+        seq = []
+        # 한 폴더는 하나의 영상이므로 트래킹 모드로 실행하고, 폴더마다 새로 만들어서 이전 영상의 추적 상태를 끊음
+        with mp_hands.Hands(static_image_mode=False, max_num_hands=2, min_detection_confidence=0.5) as hands:
+            for img_name in img_list:
+                image = cv2.imread(os.path.join(img_path, img_name))
+                if image is None:
+                    print(f"Warning: 이미지 {os.path.join(img_path, img_name)}를 읽을 수 없습니다.")
+                    continue
+                results = hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+                seq.append(landmarks_to_vector(results))
+        if not seq:
+            continue
+
+        label, sign_type = annotation_dict[folder_name]
+        label = str(label)
+        features.append(np.stack(seq))
+        lengths.append(len(seq))
+        labels.append(label)
+        types.append(sign_type)
+        folders.append(folder_name)
+        print(f"[{i + 1}/{len(folder_list)}] {folder_name}: {len(seq)} 프레임")
+
+    if not features:
+        raise ValueError("랜드마크를 추출할 데이터가 없습니다.")
+
+    # 가변 길이 시퀀스는 하나의 배열로 이어 붙이고 길이만 따로 저장
+    np.savez_compressed(cache_path,
+                        features=np.concatenate(features).astype(np.float32),
+                        lengths=np.array(lengths),
+                        labels=np.array(labels),
+                        types=np.array(types),
+                        folders=np.array(folders))
+    print(f"랜드마크 캐시 저장 완료: {cache_path} ({len(features)}개 시퀀스)")
+    return cache_path
+
+
+def sliding_windows(seq, seq_len, stride):
+    """
+    시퀀스에서 연속된 seq_len개 프레임 구간을 stride 간격으로 잘라냄
+    서버는 최근 seq_len개 연속 프레임으로 추론하므로 학습도 같은 형태의 연속 구간을 사용
+    짧으면 앞쪽을 0으로 채운 구간 하나를 만들고, 마지막 구간은 항상 마지막 프레임에서 끝나도록 함
+    :return: (구간 수, seq_len, NUM_FEATURES)
+    """
+    if seq.shape[0] <= seq_len:
+        padded = np.zeros((1, seq_len, seq.shape[1]), dtype=np.float32)
+        padded[0, seq_len - seq.shape[0]:] = seq
+        return padded
+    starts = list(range(0, seq.shape[0] - seq_len + 1, stride))
+    if starts[-1] != seq.shape[0] - seq_len:
+        starts.append(seq.shape[0] - seq_len)
+    return np.stack([seq[start:start + seq_len] for start in starts]).astype(np.float32)
+
+
+def load_landmark_dataset(cache_path=DEFAULT_CACHE_PATH, seq_len=30, types=None, stride=None):
+    """
+    캐시된 랜드마크를 읽어서 연속 프레임 구간 단위의 학습용 배열로 변환
+    :param types: 사용할 타입 목록 (예: ["단어"]). None이면 전부 사용
+    :param stride: 구간 사이 간격(프레임). None이면 seq_len의 절반
+    :return: X (구간 수, seq_len, NUM_FEATURES), labels (구간 수,),
+             clips (구간 수,) 구간을 잘라낸 영상 번호. 같은 영상의 구간이 학습/검증에 나뉘지 않도록 분리할 때 사용
+    """
+    if stride is None:
+        stride = max(1, seq_len // 2)
+    cache = np.load(cache_path)
+    features, lengths, labels = cache["features"], cache["lengths"], cache["labels"]
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    selected = np.arange(len(lengths))
+    if types is not None:
+        selected = selected[np.isin(cache["types"], types)]
+
+    windows, clips = [], []
+    for i in selected:
+        seq_windows = sliding_windows(features[offsets[i]:offsets[i + 1]], seq_len, stride)
+        windows.append(seq_windows)
+        clips.append(np.full(len(seq_windows), i))
+    X = np.concatenate(windows) if windows else np.empty((0, seq_len, NUM_FEATURES), dtype=np.float32)
+    clips = np.concatenate(clips) if clips else np.empty(0, dtype=int)
+    return X, labels[clips], clips
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수어 데이터셋에서 손 랜드마크를 추출해서 캐시")
+    parser.add_argument("--data-path", default=None)
+    parser.add_argument("--annotation-path", default=None)
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH)
+    args = parser.parse_args()
+    extract_landmarks(args.data_path, args.annotation_path, args.cache)
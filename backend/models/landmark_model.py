@@ -0,0 +1,114 @@
+import os
+import pickle
+import numpy as np
+import tensorflow as tf
+
+# 프레임 하나의 특징 벡터: 양손(왼손, 오른손) x 21개 랜드마크 x (x, y, z)
+NUM_HANDS = 2
+NUM_LANDMARKS = 21
+NUM_FEATURES = NUM_HANDS * NUM_LANDMARKS * 3
+
+
+def normalize_hand(coords):
+    """
+    손 하나의 랜드마크 좌표를 손목 기준으로 이동하고 손 크기로 나눠서 정규화
+    화면 속 손의 위치나 카메라와의 거리에 관계없이 같은 모양이면 같은 값이 나오도록 함
+    :param coords: (21, 3) 배열
+    """
+    coords = coords - coords[0]
+    scale = np.linalg.norm(coords[:, :2], axis=1).max()
+    if scale > 0:
+        coords = coords / scale
+    return coords
+
+
+def landmarks_to_vector(results):
+    """
+    MediaPipe Hands 결과를 고정 길이 특징 벡터로 변환
+    손잡이(handedness)에 따라 왼손/오른손 자리에 넣고, 감지되지 않은 손은 0으로 채움
+    :param results: mp_hands.Hands.process()의 반환값
+    :return: (NUM_FEATURES,) float32 배열
+    """
+    vector = np.zeros((NUM_HANDS, NUM_LANDMARKS, 3), dtype=np.float32)
+    if not results.multi_hand_landmarks:
+        return vector.reshape(-1)
+
+    used = [False] * NUM_HANDS
+    for i, hand_landmarks in enumerate(results.multi_hand_landmarks[:NUM_HANDS]):
+        slot = i
+        if results.multi_handedness:
+            slot = 0 if results.multi_handedness[i].classification[0].label == "Left" else 1
+        # 같은 손으로 두 번 감지된 경우에는 남은 자리에 넣음
+        if used[slot]:
+            slot = 1 - slot
+        used[slot] = True
+        coords = np.array([[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark], dtype=np.float32)
+        vector[slot] = normalize_hand(coords)
+    return vector.reshape(-1)
+
+
+def build_landmark_model(num_classes=5, seq_len=30, num_features=NUM_FEATURES):
+    """
+    손 랜드마크 시퀀스를 분류하는 경량 모델 구축 함수
+    프레임당 126차원 벡터만 처리하므로 이미지 CNN+LSTM 모델보다 연산량이 훨씬 적음
+
+    Args:
+        num_classes (int): 분류할 수어 단어 개수
+        seq_len (int): 시퀀스 길이
+        num_features (int): 프레임당 특징 수
+
+    Returns:
+        model: 구축된 Tensorflow 모델
+    """
+    inputs = tf.keras.Input(shape=(seq_len, num_features))
+    # 손이 감지되지 않은 프레임(0 벡터)은 건너뜀
+    masked = tf.keras.layers.Masking(mask_value=0.0)(inputs)
+    dense = tf.keras.layers.TimeDistributed(tf.keras.layers.Dense(64, activation="relu"))(masked)
+    layer_gru = tf.keras.layers.GRU(64)(dense)
+    layer_dropout = tf.keras.layers.Dropout(0.25)(layer_gru)
+    outputs = tf.keras.layers.Dense(num_classes, activation="softmax")(layer_dropout)
+
+    model = tf.keras.models.Model(inputs=inputs, outputs=outputs)
+    model.compile(loss="categorical_crossentropy", optimizer="adam", metrics=["accuracy"])
+    return model
+
+
+# 랜드마크 캐시가 있는 경우에 실행되는 학습 코드
+if __name__ == "__main__":
+    import argparse
+    import landmark_dataset as ld
+    import dataset_prepare as dp
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="손 랜드마크 시퀀스 모델 학습")
+    parser.add_argument("--cache", default=os.path.join(base_dir, "landmark_cache.npz"))
+    parser.add_argument("--seq-len", type=int, default=30)
+    parser.add_argument("--stride", type=int, default=None, help="연속 프레임 구간 사이 간격 (기본: seq-len의 절반)")
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--output", default=os.path.join(base_dir, "landmark_model.h5"))
+    parser.add_argument("--word-dict", default=os.path.join(base_dir, "landmark_word_dict.pickle"))
+    args = parser.parse_args()
+
+    print("랜드마크 데이터 로딩 중...")
+    X, labels, clips = ld.load_landmark_dataset(args.cache, seq_len=args.seq_len, stride=args.stride)
+    unique = np.unique(labels)
+    unique_idx_dict = dict(zip(unique.tolist(), range(len(unique))))
+    y = np.array([unique_idx_dict[label] for label in labels])
+    print(f"데이터 로드 완료: {X.shape}, 고유 단어 수: {len(unique)}")
+
+    # 검증셋 분리 (단어별로 균일하게). 같은 영상에서 잘라낸 구간은 겹치므로 영상 단위로 나눔
+    clip_ids, first = np.unique(clips, return_index=True)
+    _, _, valid_clips, _ = dp.train_test_split(clip_ids, y[first], category=len(unique))
+    valid = np.isin(clips, valid_clips)
+    X_train, y_train, X_valid, y_valid = X[~valid], y[~valid], X[valid], y[valid]
+
+    model = build_landmark_model(num_classes=len(unique), seq_len=args.seq_len)
+    model.summary()
+    model.fit(X_train, tf.keras.utils.to_categorical(y_train, len(unique)),
+              batch_size=64, epochs=args.epochs, verbose=1,
+              validation_data=(X_valid, tf.keras.utils.to_categorical(y_valid, len(unique))))
+
+    model.save(args.output)
+    with open(args.word_dict, "wb") as file:
+        pickle.dump(unique_idx_dict, file)
+    print("모델 및 단어 사전 저장 완료")
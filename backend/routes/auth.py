@@ -2,30 +2,64 @@ from flask import Blueprint, request, jsonify
 import os
 import jwt
 import datetime
-import pymongo
+import functools
+import hashlib
 from werkzeug.security import generate_password_hash, check_password_hash
 from bson.objectid import ObjectId
+from pymongo.errors import DuplicateKeyError
+from services.database import get_db
+from services.ttl_cache import TTLCache
 
 auth_bp = Blueprint('auth', __name__)
 
-# MongoDB 연결
-def get_db():
-    mongo_user = os.getenv('MONGO_USER', '')
-    mongo_password = os.getenv('MONGO_PASSWORD', '')
-    mongo_host = os.getenv('MONGO_HOST', 'localhost')
-    mongo_port = os.getenv('MONGO_PORT', '27017')
-    
-    if mongo_user and mongo_password:
-        uri = f"mongodb://{mongo_user}:{mongo_password}@{mongo_host}:{mongo_port}/"
-    else:
-        uri = f"mongodb://{mongo_host}:{mongo_port}/"
-        
-    client = pymongo.MongoClient(uri)
-    return client.sueorang_db
-
 # JWT 비밀키
 SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'supersecretkey')
 
+# 검증된 토큰 캐시: 같은 토큰은 만료 전까지 서명 검증을 다시 하지 않음
+token_cache = TTLCache(
+    maxsize=int(os.getenv('AUTH_TOKEN_CACHE_SIZE', '10000')),
+    ttl=float(os.getenv('AUTH_TOKEN_CACHE_TTL', '300'))
+)
+# 사용자 정보 캐시: 사용자 정보를 수정하는 API가 없으므로 변경 시 제거하지 않고 짧은 TTL로 만료
+user_cache = TTLCache(
+    maxsize=int(os.getenv('USER_CACHE_SIZE', '1000')),
+    ttl=float(os.getenv('USER_CACHE_TTL', '60'))
+)
+
+
+def verify_token(token):
+    """
+    JWT를 검증하고 payload를 반환. 검증 결과는 토큰의 해시를 키로 토큰 만료 시각까지 캐시
+    검증에 실패하면 jwt.ExpiredSignatureError 또는 jwt.InvalidTokenError 발생
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
+        token_cache.set(key, payload, expires_at=payload.get('exp'))
+    return payload
+
+
+def get_user_profile(user_id):
+    """
+    응답용 사용자 정보를 반환. 캐시에 없으면 DB에서 조회하고, 사용자가 없으면 None
+    """
+    user = user_cache.get(user_id)
+    if user is None:
+        doc = get_db().users.find_one({'_id': ObjectId(user_id)},
+                                      {'email': 1, 'name': 1, 'gender': 1})
+        if not doc:
+            return None
+        user = {
+            'id': str(doc['_id']),
+            'email': doc['email'],
+            'name': doc['name'],
+            'gender': doc['gender']
+        }
+        user_cache.set(user_id, user)
+    return user
+
+
 # 회원가입
 @auth_bp.route('/register', methods=['POST'])
 def register():
@@ -51,14 +85,18 @@ def register():
     hashed_password = generate_password_hash(password)
     
     # 사용자 정보 저장
-    user_id = db.users.insert_one({
-        'email': email,
-        'password': hashed_password,
-        'name': name,
-        'gender': gender,
-        'created_at': datetime.datetime.now(),
-        'updated_at': datetime.datetime.now()
-    }).inserted_id
+    try:
+        user_id = db.users.insert_one({
+            'email': email,
+            'password': hashed_password,
+            'name': name,
+            'gender': gender,
+            'created_at': datetime.datetime.now(),
+            'updated_at': datetime.datetime.now()
+        }).inserted_id
+    except DuplicateKeyError:
+        # 같은 이메일로 동시에 가입한 경우 users.email 유니크 인덱스에서 걸림
+        return jsonify({'message': '이미 사용 중인 이메일입니다.'}), 400
     
     return jsonify({
         'success': True,
@@ -114,22 +152,14 @@ def get_user():
     
     try:
         # 토큰 검증
-        payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
-        user_id = payload['user_id']
-        
-        db = get_db()
-        user = db.users.find_one({'_id': ObjectId(user_id)})
+        payload = verify_token(token)
+        user = get_user_profile(payload['user_id'])
         
         if not user:
             return jsonify({'message': '사용자를 찾을 수 없습니다.'}), 404
         
         return jsonify({
-            'user': {
-                'id': str(user['_id']),
-                'email': user['email'],
-                'name': user['name'],
-                'gender': user['gender']
-            }
+            'user': user
         }), 200
     except jwt.ExpiredSignatureError:
         return jsonify({'message': '만료된 토큰입니다.'}), 401
@@ -138,6 +168,7 @@ def get_user():
 
 # 인증 미들웨어 (다른 파일에서 사용)
 def token_required(f):
+    @functools.wraps(f)
     def decorated(*args, **kwargs):
         token = request.headers.get('Authorization', '').replace('Bearer ', '')
         
@@ -145,12 +176,13 @@ def token_required(f):
             return jsonify({'message': '인증 토큰이 필요합니다.'}), 401
         
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
+            payload = verify_token(token)
             request.user_id = payload['user_id']
-            return f(*args, **kwargs)
         except jwt.ExpiredSignatureError:
             return jsonify({'message': '만료된 토큰입니다.'}), 401
         except (jwt.InvalidTokenError, Exception) as e:
             return jsonify({'message': f'유효하지 않은 토큰입니다: {str(e)}'}), 401
+        
+        return f(*args, **kwargs)
             
     return decorated 
\ No newline at end of file
@@ -1,35 +1,33 @@
-from flask import Blueprint, request, jsonify
-import os
+from flask import Blueprint, request, jsonify, Response
+from werkzeug.wsgi import wrap_file
 import datetime
-import pymongo
+import hashlib
 from bson.objectid import ObjectId
+from services.database import get_db
+from services.image_store import open_image, decode_image, delete_unreferenced_images, HAS_IMAGE
+from services.pagination import parse_page_args, find_page
+from services.bulk_ops import parse_ids, delete_saved_signs
 from routes.auth import token_required
 
 signs_bp = Blueprint('signs', __name__)
 
-# MongoDB 연결
-def get_db():
-    mongo_user = os.getenv('MONGO_USER', '')
-    mongo_password = os.getenv('MONGO_PASSWORD', '')
-    mongo_host = os.getenv('MONGO_HOST', 'localhost')
-    mongo_port = os.getenv('MONGO_PORT', '27017')
-    
-    if mongo_user and mongo_password:
-        uri = f"mongodb://{mongo_user}:{mongo_password}@{mongo_host}:{mongo_port}/"
-    else:
-        uri = f"mongodb://{mongo_host}:{mongo_port}/"
-        
-    client = pymongo.MongoClient(uri)
-    return client.sueorang_db
-
 # 저장된 수어 목록 조회
 @signs_bp.route('/saved', methods=['GET'])
 @token_required
 def get_saved_signs():
+    # 저장된 수어를 페이지 단위로 조회 (?limit=20&cursor=...)
+    try:
+        limit, after = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
     db = get_db()
-    saved_signs = list(db.saved_signs.find(
-        {'user_id': request.user_id}
-    ).sort('saved_at', -1))
+    # (user_id, saved_at, _id) 인덱스를 사용하고, 이미지 필드는 쿼리 단계에서 제외
+    # 이미지는 유무(has_image)만 계산해서 돌려주고 /api/signs/image/<id>로 따로 조회
+    saved_signs, next_cursor = find_page(
+        db.saved_signs, {'user_id': request.user_id}, 'saved_at',
+        limit, after, projection={'image': 0, 'image_id': 0}, add_fields={'has_image': HAS_IMAGE}
+    )
     
     # ObjectId를 문자열로 변환
     for sign in saved_signs:
@@ -37,14 +35,10 @@ def get_saved_signs():
         del sign['_id']
         sign['translation_id'] = str(sign['translation_id'])
         sign['savedAt'] = sign['saved_at'].strftime('%Y-%m-%d')
-        
-        # 이미지는 너무 커서 응답에 포함시키지 않음 (필요시 별도 API 구현)
-        if 'image' in sign:
-            sign['has_image'] = True
-            del sign['image']
     
     return jsonify({
-        'signs': saved_signs
+        'signs': saved_signs,
+        'next_cursor': next_cursor
     }), 200
 
 # 저장된 수어 상세 조회
@@ -66,6 +60,8 @@ def get_saved_sign_detail(sign_id):
         del sign['_id']
         sign['translation_id'] = str(sign['translation_id'])
         sign['savedAt'] = sign['saved_at'].strftime('%Y-%m-%d %H:%M:%S')
+        if sign.get('image_id') or sign.get('image'):
+            sign['image_url'] = f"/api/signs/image/{sign['id']}"
         
         return jsonify({
             'sign': sign
@@ -99,13 +95,50 @@ def delete_saved_sign(sign_id):
                 {'$set': {'is_saved': False}}
             )
         
+        # 더 이상 참조되지 않는 이미지 삭제
+        delete_unreferenced_images([sign.get('image_id')])
+        
         return jsonify({
             'message': '저장된 수어가 삭제되었습니다.'
         }), 200
     except Exception as e:
         return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
 
-# 이미지 가져오기 API
+# 저장된 수어 여러 개 일괄 삭제 ({"ids": [...]})
+@signs_bp.route('/saved/bulk-delete', methods=['POST'])
+@token_required
+def bulk_delete_saved_signs():
+    data = request.json or {}
+    try:
+        ids = parse_ids(data.get('ids'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    try:
+        deleted, not_found, image_ids = delete_saved_signs(request.user_id, ids)
+        
+        # 더 이상 참조되지 않는 이미지 삭제
+        delete_unreferenced_images(image_ids)
+        
+        return jsonify({
+            'deleted': [str(i) for i in deleted],
+            'not_found': [str(i) for i in not_found],
+            'message': f'{len(deleted)}개 저장된 수어가 삭제되었습니다.'
+        }), 200
+    except Exception as e:
+        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
+
+# 이미지 응답 생성. ETag(내용 해시)와 Range 요청을 지원
+def make_image_response(body, content_type, length, etag):
+    response = Response(body, mimetype=content_type, direct_passthrough=True)
+    response.content_length = length
+    response.set_etag(etag)
+    # 이미지 내용은 ID(해시)에 따라 바뀌지 않으므로 브라우저/앱에서 캐시 가능
+    response.cache_control.private = True
+    response.cache_control.max_age = 86400
+    return response.make_conditional(request.environ, accept_ranges=True, complete_length=length)
+
+# 이미지 가져오기 API (바이너리 스트리밍)
 @signs_bp.route('/image/<sign_id>', methods=['GET'])
 @token_required
 def get_sign_image(sign_id):
@@ -114,13 +147,19 @@ def get_sign_image(sign_id):
         sign = db.saved_signs.find_one({
             '_id': ObjectId(sign_id),
             'user_id': request.user_id
-        })
+        }, {'image_id': 1, 'image': 1})
         
-        if not sign or 'image' not in sign:
-            return jsonify({'message': '이미지를 찾을 수 없습니다.'}), 404
+        if sign and sign.get('image_id'):
+            image = open_image(sign['image_id'])
+            if image is not None:
+                metadata = image.metadata or {}
+                return make_image_response(wrap_file(request.environ, image), metadata.get('content_type', 'image/jpeg'),
+                                           image.length, sign['image_id'])
+        elif sign and sign.get('image'):
+            # 이미지 저장소로 옮기기 전 문서는 문서 안의 Base64 이미지를 디코딩해서 반환
+            data, content_type = decode_image(sign['image'])
+            return make_image_response([data], content_type, len(data), hashlib.sha256(data).hexdigest())
         
-        return jsonify({
-            'image': sign['image']
-        }), 200
+        return jsonify({'message': '이미지를 찾을 수 없습니다.'}), 404
     except Exception as e:
-        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500 
\ No newline at end of file
+        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
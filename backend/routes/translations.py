@@ -1,27 +1,14 @@
 from flask import Blueprint, request, jsonify
-import os
 import datetime
-import pymongo
 from bson.objectid import ObjectId
+from services.database import get_db
+from services.image_store import save_image, delete_unreferenced_images, HAS_IMAGE
+from services.pagination import parse_page_args, find_page
+from services.bulk_ops import parse_ids, set_translations_saved, delete_translations
 from routes.auth import token_required
 
 translations_bp = Blueprint('translations', __name__)
 
-# MongoDB 연결
-def get_db():
-    mongo_user = os.getenv('MONGO_USER', '')
-    mongo_password = os.getenv('MONGO_PASSWORD', '')
-    mongo_host = os.getenv('MONGO_HOST', 'localhost')
-    mongo_port = os.getenv('MONGO_PORT', '27017')
-    
-    if mongo_user and mongo_password:
-        uri = f"mongodb://{mongo_user}:{mongo_password}@{mongo_host}:{mongo_port}/"
-    else:
-        uri = f"mongodb://{mongo_host}:{mongo_port}/"
-        
-    client = pymongo.MongoClient(uri)
-    return client.sueorang_db
-
 # 번역 결과 저장
 @translations_bp.route('', methods=['POST'])
 @token_required
@@ -37,12 +24,19 @@ def save_translation():
     if not word:
         return jsonify({'message': '번역 결과가 없습니다.'}), 400
     
+    # 이미지는 GridFS에 한 번만 저장하고 문서에는 ID만 기록
+    image_id = None
+    if image:
+        image_id = save_image(image)
+        if image_id is None:
+            return jsonify({'message': '이미지 형식이 올바르지 않습니다.'}), 400
+    
     # 번역 결과 저장
     db = get_db()
     translation_id = db.translations.insert_one({
         'user_id': request.user_id,
         'word': word,
-        'image': image,
+        'image_id': image_id,
         'is_saved': False,
         'created_at': datetime.datetime.now()
     }).inserted_id
@@ -56,11 +50,19 @@ def save_translation():
 @translations_bp.route('/recent', methods=['GET'])
 @token_required
 def get_recent_translations():
-    # 최근 20개 번역 내역 조회
+    # 최근 번역 내역을 페이지 단위로 조회 (?limit=20&cursor=...)
+    try:
+        limit, after = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
     db = get_db()
-    translations = list(db.translations.find(
-        {'user_id': request.user_id}
-    ).sort('created_at', -1).limit(20))
+    # (user_id, created_at, _id) 인덱스를 사용하고, 이미지 필드는 쿼리 단계에서 제외
+    # 이미지는 유무(has_image)만 계산해서 돌려주고 /api/signs/image/<id>로 따로 조회
+    translations, next_cursor = find_page(
+        db.translations, {'user_id': request.user_id}, 'created_at',
+        limit, after, projection={'image': 0, 'image_id': 0}, add_fields={'has_image': HAS_IMAGE}
+    )
     
     # ObjectId를 문자열로 변환
     for t in translations:
@@ -68,13 +70,10 @@ def get_recent_translations():
         del t['_id']
         t['date'] = t['created_at'].strftime('%Y-%m-%d')
         t['time'] = t['created_at'].strftime('%H:%M:%S')
-        # 이미지는 너무 커서 응답에 포함시키지 않음 (필요시 별도 API 구현)
-        if 'image' in t:
-            t['has_image'] = True
-            del t['image']
     
     return jsonify({
-        'translations': translations
+        'translations': translations,
+        'next_cursor': next_cursor
     }), 200
 
 # 번역 결과 저장 상태 토글
@@ -112,7 +111,7 @@ def toggle_save_status(translation_id):
                     'user_id': request.user_id,
                     'translation_id': ObjectId(translation_id),
                     'word': translation['word'],
-                    'image': translation.get('image'),
+                    'image_id': translation.get('image_id'),
                     'saved_at': datetime.datetime.now()
                 })
         else:
@@ -135,12 +134,12 @@ def toggle_save_status(translation_id):
 def delete_translation(translation_id):
     try:
         db = get_db()
-        result = db.translations.delete_one({
+        translation = db.translations.find_one_and_delete({
             '_id': ObjectId(translation_id),
             'user_id': request.user_id
-        })
+        }, projection={'image_id': 1})
         
-        if result.deleted_count == 0:
+        if not translation:
             return jsonify({'message': '번역 결과를 찾을 수 없습니다.'}), 404
         
         # 저장된 수어에서도 제거
@@ -149,8 +148,60 @@ def delete_translation(translation_id):
             'user_id': request.user_id
         })
         
+        # 더 이상 참조되지 않는 이미지 삭제
+        delete_unreferenced_images([translation.get('image_id')])
+        
         return jsonify({
             'message': '번역 결과가 삭제되었습니다.'
         }), 200
     except Exception as e:
-        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500 
\ No newline at end of file
+        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
+
+# 번역 결과 여러 개의 저장 상태 일괄 변경 ({"ids": [...], "saved": true})
+@translations_bp.route('/bulk-save', methods=['POST'])
+@token_required
+def bulk_save_translations():
+    data = request.json or {}
+    try:
+        ids = parse_ids(data.get('ids'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    saved = data.get('saved', True)
+    if not isinstance(saved, bool):
+        return jsonify({'message': 'saved는 true 또는 false여야 합니다.'}), 400
+    
+    try:
+        updated, not_found = set_translations_saved(request.user_id, ids, saved)
+        return jsonify({
+            'updated': [str(i) for i in updated],
+            'not_found': [str(i) for i in not_found],
+            'is_saved': saved,
+            'message': f'{len(updated)}개 번역 결과의 저장 상태가 업데이트되었습니다.'
+        }), 200
+    except Exception as e:
+        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
+
+# 번역 결과 여러 개 일괄 삭제 ({"ids": [...]})
+@translations_bp.route('/bulk-delete', methods=['POST'])
+@token_required
+def bulk_delete_translations():
+    data = request.json or {}
+    try:
+        ids = parse_ids(data.get('ids'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    try:
+        deleted, not_found, image_ids = delete_translations(request.user_id, ids)
+        
+        # 더 이상 참조되지 않는 이미지 삭제
+        delete_unreferenced_images(image_ids)
+        
+        return jsonify({
+            'deleted': [str(i) for i in deleted],
+            'not_found': [str(i) for i in not_found],
+            'message': f'{len(deleted)}개 번역 결과가 삭제되었습니다.'
+        }), 200
+    except Exception as e:
+        return jsonify({'message': f'오류가 발생했습니다: {str(e)}'}), 500
@@ -0,0 +1,138 @@
+import datetime
+import os
+from contextlib import contextmanager
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from services.database import get_client, get_db
+
+# 한 번의 일괄 요청으로 처리할 수 있는 최대 ID 수
+BULK_MAX_IDS = int(os.getenv('BULK_MAX_IDS', '100'))
+# 일괄 작업을 트랜잭션으로 묶을지 여부 (MongoDB가 레플리카 셋이나 샤드 클러스터일 때만 가능)
+MONGO_TRANSACTIONS = os.getenv('MONGO_TRANSACTIONS', 'False').lower() == 'true'
+
+
+def parse_ids(ids):
+    """
+    요청의 ID 목록을 중복 없는 ObjectId 목록으로 변환. 올바르지 않으면 ValueError 발생
+    """
+    if not isinstance(ids, list) or not ids:
+        raise ValueError('ids는 비어 있지 않은 목록이어야 합니다.')
+    if len(ids) > BULK_MAX_IDS:
+        raise ValueError(f'한 번에 최대 {BULK_MAX_IDS}개까지 처리할 수 있습니다.')
+    try:
+        return list(dict.fromkeys(ObjectId(i) for i in ids))
+    except (InvalidId, TypeError) as e:
+        raise ValueError('올바르지 않은 ID가 있습니다.') from e
+
+
+def missing_ids(ids, found):
+    found = set(found)
+    return [i for i in ids if i not in found]
+
+
+@contextmanager
+def bulk_session():
+    """
+    일괄 작업의 모든 쿼리가 사용할 세션. MONGO_TRANSACTIONS가 켜져 있으면 트랜잭션으로 묶음
+    """
+    with get_client().start_session() as session:
+        if MONGO_TRANSACTIONS:
+            with session.start_transaction():
+                yield session
+        else:
+            yield session
+
+
+def set_translations_saved(user_id, ids, saved):
+    """
+    번역 결과 여러 개의 저장 상태를 한 번에 변경하고 저장된 수어 목록에도 추가/제거
+    항목 수와 관계없이 쿼리 3번으로 처리
+    :return: (처리한 번역 ID 목록, 찾지 못한 ID 목록)
+    """
+    db = get_db()
+    with bulk_session() as session:
+        translations = list(db.translations.find(
+            {'_id': {'$in': ids}, 'user_id': user_id},
+            {'word': 1, 'image_id': 1},
+            session=session
+        ))
+        found = [t['_id'] for t in translations]
+        if found:
+            db.translations.update_many(
+                {'_id': {'$in': found}},
+                {'$set': {'is_saved': saved}},
+                session=session
+            )
+            if saved:
+                # 이미 저장된 번역은 그대로 두고 없는 것만 추가
+                now = datetime.datetime.now()
+                db.saved_signs.bulk_write([
+                    UpdateOne(
+                        {'translation_id': t['_id'], 'user_id': user_id},
+                        {'$setOnInsert': {
+                            'word': t['word'],
+                            'image_id': t.get('image_id'),
+                            'saved_at': now
+                        }},
+                        upsert=True
+                    )
+                    for t in translations
+                ], ordered=False, session=session)
+            else:
+                db.saved_signs.delete_many(
+                    {'translation_id': {'$in': found}, 'user_id': user_id},
+                    session=session
+                )
+    return found, missing_ids(ids, found)
+
+
+def delete_translations(user_id, ids):
+    """
+    번역 결과 여러 개와 그 번역의 저장된 수어를 한 번에 삭제
+    :return: (삭제한 번역 ID 목록, 찾지 못한 ID 목록, 삭제한 문서가 참조하던 이미지 ID 목록)
+    """
+    db = get_db()
+    with bulk_session() as session:
+        translations = list(db.translations.find(
+            {'_id': {'$in': ids}, 'user_id': user_id},
+            {'image_id': 1},
+            session=session
+        ))
+        found = [t['_id'] for t in translations]
+        if found:
+            db.translations.delete_many({'_id': {'$in': found}}, session=session)
+            db.saved_signs.delete_many(
+                {'translation_id': {'$in': found}, 'user_id': user_id},
+                session=session
+            )
+    image_ids = [t.get('image_id') for t in translations]
+    return found, missing_ids(ids, found), image_ids
+
+
+def delete_saved_signs(user_id, ids):
+    """
+    저장된 수어 여러 개를 한 번에 삭제하고 원래 번역 결과의 저장 상태를 해제
+    :return: (삭제한 저장된 수어 ID 목록, 찾지 못한 ID 목록, 삭제한 문서가 참조하던 이미지 ID 목록)
+    """
+    db = get_db()
+    with bulk_session() as session:
+        signs = list(db.saved_signs.find(
+            {'_id': {'$in': ids}, 'user_id': user_id},
+            {'translation_id': 1, 'image_id': 1},
+            session=session
+        ))
+        found = [s['_id'] for s in signs]
+        if found:
+            db.saved_signs.delete_many({'_id': {'$in': found}}, session=session)
+            translation_ids = [s['translation_id'] for s in signs if s.get('translation_id')]
+            if translation_ids:
+                db.translations.update_many(
+                    {'_id': {'$in': translation_ids}, 'user_id': user_id},
+                    {'$set': {'is_saved': False}},
+                    session=session
+                )
+    image_ids = [s.get('image_id') for s in signs]
+    return found, missing_ids(ids, found), image_ids
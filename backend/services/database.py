@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from urllib.parse import quote_plus
+
+import pymongo
+
+MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'sueorang_db')
+# 커넥션 풀 크기. 동시에 MongoDB를 사용하는 요청 스레드 수 이상으로 설정
+MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', '50'))
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', '0'))
+# 서버를 찾지 못했을 때 요청이 기다리는 최대 시간(밀리초)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', '5000'))
+
+_client = None
+_lock = threading.Lock()
+
+
+def build_mongo_uri():
+    mongo_user = os.getenv('MONGO_USER', '')
+    mongo_password = os.getenv('MONGO_PASSWORD', '')
+    mongo_host = os.getenv('MONGO_HOST', 'localhost')
+    mongo_port = os.getenv('MONGO_PORT', '27017')
+
+    if mongo_user and mongo_password:
+        return f"mongodb://{quote_plus(mongo_user)}:{quote_plus(mongo_password)}@{mongo_host}:{mongo_port}/"
+    return f"mongodb://{mongo_host}:{mongo_port}/"
+
+
+def init_client():
+    """
+    프로세스 전체에서 공유할 MongoClient를 만듦
+    MongoClient는 내부에 커넥션 풀을 가지고 스레드 안전하므로 요청마다 새로 만들지 않고 하나만 사용
+    connect=False로 첫 사용 시점에 연결하므로 fork 이전에 만들어도 안전
+    """
+    global _client
+    with _lock:
+        if _client is None:
+            _client = pymongo.MongoClient(
+                build_mongo_uri(),
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                minPoolSize=MONGO_MIN_POOL_SIZE,
+                serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+                connect=False
+            )
+        return _client
+
+
+def get_client():
+    client = _client
+    if client is None:
+        client = init_client()
+    return client
+
+
+def get_db():
+    return get_client()[MONGO_DB_NAME]
+
+
+def close_client():
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# 컬렉션별 인덱스 정의: (컬렉션, 키, 옵션)
+INDEXES = [
+    # 최근 번역 내역: user_id로 찾고 (created_at, _id) 역순 키셋 페이지네이션
+    ('translations', [('user_id', pymongo.ASCENDING), ('created_at', pymongo.DESCENDING),
+                      ('_id', pymongo.DESCENDING)],
+     {'name': 'user_id_created_at_id'}),
+    # 저장된 수어 목록: user_id로 찾고 (saved_at, _id) 역순 키셋 페이지네이션
+    ('saved_signs', [('user_id', pymongo.ASCENDING), ('saved_at', pymongo.DESCENDING),
+                     ('_id', pymongo.DESCENDING)],
+     {'name': 'user_id_saved_at_id'}),
+    # 번역 결과 저장/삭제 시 해당 번역의 저장된 수어 조회
+    ('saved_signs', [('translation_id', pymongo.ASCENDING), ('user_id', pymongo.ASCENDING)],
+     {'name': 'translation_id_user_id'}),
+    # 회원가입 이메일 중복 방지 및 로그인 조회
+    ('users', [('email', pymongo.ASCENDING)],
+     {'name': 'email_unique', 'unique': True})
+]
+
+# 더 이상 사용하지 않는 인덱스: (컬렉션, 이름)
+OBSOLETE_INDEXES = [
+    ('translations', 'user_id_created_at'),
+    ('saved_signs', 'user_id_saved_at')
+]
+
+
+def ensure_indexes():
+    """
+    INDEXES에 정의된 인덱스를 생성. 이미 있는 인덱스는 그대로 두므로 서버 시작 시마다 호출해도 됨
+    """
+    db = get_db()
+    for collection, keys, options in INDEXES:
+        db[collection].create_index(keys, **options)
+    # 키셋 페이지네이션용 인덱스로 대체된 이전 인덱스 제거
+    for collection, name in OBSOLETE_INDEXES:
+        if name in db[collection].index_information():
+            db[collection].drop_index(name)
+
+
+# 인덱스를 사용하지 않을 때 나타나는 실행 계획 단계 (컬렉션 전체 스캔, 메모리 정렬)
+BAD_PLAN_STAGES = {'COLLSCAN', 'SORT', '$sort'}
+
+
+def plan_stages(plan):
+    """
+    explain() 결과의 실행 계획에서 단계 이름(IXSCAN, COLLSCAN, SORT 등)을 모두 모음
+    """
+    stages = []
+    if 'stage' in plan:
+        stages.append(plan['stage'])
+    for key in ['inputStage', 'queryPlan']:
+        if key in plan:
+            stages.extend(plan_stages(plan[key]))
+    for child in plan.get('inputStages', []):
+        stages.extend(plan_stages(child))
+    return stages
+
+
+def pipeline_stages(explain):
+    """
+    aggregate explain 결과에서 쿼리 실행 계획 단계와, 쿼리 단계로 합쳐지지 않은 파이프라인 단계($sort 등) 이름을 모음
+    """
+    if 'queryPlanner' in explain:
+        return plan_stages(explain['queryPlanner']['winningPlan'])
+    stages = []
+    for stage in explain['stages']:
+        if '$cursor' in stage:
+            stages.extend(plan_stages(stage['$cursor']['queryPlanner']['winningPlan']))
+        else:
+            stages.extend(stage)
+    return stages
+
+
+def uses_index(stages):
+    """
+    실행 계획 단계에 인덱스 스캔(IXSCAN, EXPRESS_IXSCAN 등)이 있고 전체 스캔이나 메모리 정렬이 없는지 확인
+    """
+    return any('IXSCAN' in stage for stage in stages) and not BAD_PLAN_STAGES & set(stages)
+
+
+def explain_queries():
+    """
+    블루프린트의 주요 조회 쿼리를 explain()해서 실행 계획 단계를 반환
+    인덱스를 제대로 사용하면 IXSCAN이 있고 COLLSCAN과 메모리 정렬(SORT)이 없어야 함
+    :return: {쿼리 이름: [단계 이름, ...]}
+    """
+    import datetime
+    from bson.objectid import ObjectId
+    from services.image_store import HAS_IMAGE
+    from services.pagination import page_pipeline
+
+    db = get_db()
+    user_id = 'explain-check'
+    after = (datetime.datetime.now(), ObjectId())
+    # 목록 API와 같은 파이프라인
+    list_options = {'projection': {'image': 0, 'image_id': 0}, 'add_fields': {'has_image': HAS_IMAGE}}
+    pipelines = {
+        'translations.recent': ('translations', page_pipeline(
+            {'user_id': user_id}, 'created_at', 20, **list_options)),
+        'translations.recent_next': ('translations', page_pipeline(
+            {'user_id': user_id}, 'created_at', 20, after, **list_options)),
+        'saved_signs.saved': ('saved_signs', page_pipeline(
+            {'user_id': user_id}, 'saved_at', 20, **list_options))
+    }
+    cursors = {
+        'saved_signs.by_translation': db.saved_signs.find({'translation_id': ObjectId(), 'user_id': user_id}),
+        'users.email': db.users.find({'email': 'explain-check@example.com'})
+    }
+    stages = {
+        name: pipeline_stages(db.command('aggregate', collection, pipeline=pipeline, explain=True))
+        for name, (collection, pipeline) in pipelines.items()
+    }
+    stages.update({
+        name: plan_stages(cursor.explain()['queryPlanner']['winningPlan'])
+        for name, cursor in cursors.items()
+    })
+    return stages
+
+
+def check_ready():
+    """
+    MongoDB 연결 상태 확인 (ping)
+    :return: {"ok": bool, "latency_ms": float} 또는 실패 시 {"ok": False, "error": str}
+    """
+    start = time.perf_counter()
+    try:
+        get_client().admin.command('ping')
+        return {"ok": True, "latency_ms": (time.perf_counter() - start) * 1000}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
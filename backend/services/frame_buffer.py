@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+# 세션이 마지막 요청 후 유지되는 시간(초)
+SESSION_TTL = float(os.getenv('SESSION_TTL', '60'))
+# 모든 세션의 프레임 버퍼가 사용할 수 있는 최대 메모리(MB)
+SESSION_MEMORY_MB = float(os.getenv('SESSION_MEMORY_MB', '256'))
+
+
+class FrameRingBuffer:
+    """
+    최근 seq_len개의 프레임(리사이즈된 이미지 또는 랜드마크 벡터)을 보관하는 고정 크기 링 버퍼
+    버퍼는 생성 시 한 번만 할당하고, 프레임 추가는 O(1) 복사 한 번으로 끝남
+    """
+
+    def __init__(self, seq_len, frame_shape=(67, 120, 3), dtype=np.uint8):
+        self.frames = np.zeros((seq_len, *frame_shape), dtype=dtype)
+        self.seq_len = seq_len
+        # 다음 프레임이 들어갈 위치와 현재까지 채워진 프레임 수
+        self.head = 0
+        self.count = 0
+
+    @property
+    def shape(self):
+        return self.frames.shape
+
+    @property
+    def nbytes(self):
+        return self.frames.nbytes
+
+    def append(self, frame):
+        self.frames[self.head] = frame
+        self.head = (self.head + 1) % self.seq_len
+        self.count = min(self.count + 1, self.seq_len)
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def sequence(self, out=None):
+        """
+        오래된 프레임부터 순서대로 정렬된 시퀀스를 반환
+        학습 데이터와 같이 프레임이 부족한 만큼 앞쪽을 0으로 채움
+        :param out: 결과를 쓸 (seq_len, *frame_shape) 배열. 없으면 새로 할당
+        """
+        if out is None:
+            out = np.empty_like(self.frames)
+        if self.count < self.seq_len:
+            # 아직 한 바퀴를 돌지 않았으므로 프레임은 0번부터 순서대로 들어 있음
+            pad = self.seq_len - self.count
+            out[:pad] = 0
+            out[pad:] = self.frames[:self.count]
+        else:
+            tail = self.seq_len - self.head
+            out[:tail] = self.frames[self.head:]
+            out[tail:] = self.frames[:self.head]
+        return out
+
+
+class FrameSession:
+    """
+    클라이언트 세션 하나의 상태. 같은 세션의 동시 요청은 lock으로 직렬화
+    """
+
+    def __init__(self, seq_len, frame_shape, dtype):
+        self.buffer = FrameRingBuffer(seq_len, frame_shape, dtype)
+        self.lock = threading.Lock()
+        self.last_seen = time.monotonic()
+        # 마지막으로 추론한 프레임의 상태 (MotionGate에서 사용)
+        self.gate = None
+
+
+class FrameSessionStore:
+    """
+    세션 ID별 프레임 버퍼 저장소
+    TTL이 지난 세션은 제거하고, 메모리 상한을 넘으면 가장 오래 사용하지 않은 세션부터 제거
+    """
+
+    def __init__(self, ttl=SESSION_TTL, max_bytes=SESSION_MEMORY_MB * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+
+    @staticmethod
+    def new_session_id():
+        return uuid.uuid4().hex
+
+    def get(self, session_id, seq_len, frame_shape=(67, 120, 3), dtype=np.uint8):
+        """
+        세션을 가져오거나 새로 만듦
+        모델이 다시 로드되어 입력 형태가 바뀐 경우에는 버퍼를 새로 할당
+        session_id가 None이면 저장소에 등록하지 않는 일회용 세션을 반환 (메모리 상한에 포함되지 않음)
+        """
+        if session_id is None:
+            return FrameSession(seq_len, frame_shape, dtype)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(session_id)
+            if session is not None and (session.buffer.shape != (seq_len, *frame_shape)
+                                        or session.buffer.frames.dtype != dtype):
+                self._remove(session_id)
+                session = None
+            if session is None:
+                session = FrameSession(seq_len, frame_shape, dtype)
+                self._sessions[session_id] = session
+                self._nbytes += session.buffer.nbytes
+                self._evict_over_budget()
+            else:
+                self._sessions.move_to_end(session_id)
+            session.last_seen = now
+            return session
+
+    def discard(self, session_id):
+        with self._lock:
+            self._remove(session_id)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "memory_bytes": self._nbytes,
+                "memory_limit_bytes": int(self.max_bytes)
+            }
+
+    def _remove(self, session_id):
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._nbytes -= session.buffer.nbytes
+
+    def _evict_expired(self, now):
+        # OrderedDict는 최근 사용 순서이므로 앞에서부터 만료된 세션만 확인하면 됨
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_seen < self.ttl:
+                break
+            self._remove(session_id)
+
+    def _evict_over_budget(self):
+        # 방금 추가한 세션(맨 뒤)은 남겨두고 오래된 세션부터 제거
+        while self._nbytes > self.max_bytes and len(self._sessions) > 1:
+            session_id = next(iter(self._sessions))
+            self._remove(session_id)
@@ -0,0 +1,42 @@
+import threading
+
+
+class LatestFrameSlot:
+    """
+    스트리밍 연결 하나에서 아직 처리하지 않은 최신 프레임 하나만 보관하는 슬롯
+    추론이 수신 속도를 따라가지 못하면 처리 대기 중인 오래된 프레임을 버리고 최신 프레임으로 교체
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._frame = None
+        self._closed = False
+        self.received = 0
+        self.dropped = 0
+
+    def put(self, frame):
+        with self._cond:
+            if self._frame is not None:
+                # 처리되기 전에 새 프레임이 도착했으므로 이전 프레임은 버림
+                self.dropped += 1
+            self._frame = frame
+            self.received += 1
+            self._cond.notify()
+
+    def take(self):
+        """
+        새 프레임이 들어올 때까지 기다렸다가 꺼냄
+        :return: (프레임 번호, 프레임) 또는 연결이 닫혔으면 None
+        """
+        with self._cond:
+            while self._frame is None and not self._closed:
+                self._cond.wait()
+            if self._frame is None:
+                return None
+            frame, self._frame = self._frame, None
+            return self.received, frame
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,75 @@
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+import mediapipe as mp
+
+# 요청 처리용 Hands 인스턴스 수 (동시에 MediaPipe를 실행할 수 있는 요청 수)
+HANDS_POOL_SIZE = int(os.getenv('HANDS_POOL_SIZE', '4'))
+# 스트리밍 연결용 추적 모드 Hands 인스턴스 수 (동시 스트리밍 연결 수 상한)
+HANDS_STREAM_POOL_SIZE = int(os.getenv('HANDS_STREAM_POOL_SIZE', '8'))
+HANDS_MIN_DETECTION_CONFIDENCE = float(os.getenv('HANDS_MIN_DETECTION_CONFIDENCE', '0.5'))
+HANDS_MIN_TRACKING_CONFIDENCE = float(os.getenv('HANDS_MIN_TRACKING_CONFIDENCE', '0.5'))
+
+
+class HandsPool:
+    """
+    MediaPipe Hands 인스턴스 풀
+    Hands 인스턴스는 스레드 안전하지 않으므로 한 번에 한 스레드만 사용하도록 빌려주고 돌려받음
+    static_image_mode=False인 풀은 연속된 프레임에서 손 위치를 추적하므로 매 프레임 손바닥 검출을 생략함
+    인스턴스는 필요할 때 만들어서 size개까지만 유지
+    """
+
+    def __init__(self, size, static_image_mode, max_num_hands=2,
+                 min_detection_confidence=HANDS_MIN_DETECTION_CONFIDENCE,
+                 min_tracking_confidence=HANDS_MIN_TRACKING_CONFIDENCE):
+        self.size = max(1, size)
+        self.static_image_mode = static_image_mode
+        self._options = {
+            "static_image_mode": static_image_mode,
+            "max_num_hands": max_num_hands,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence
+        }
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """
+        Hands 인스턴스를 빌려줌. 모두 사용 중이면 timeout 동안 기다리고, 그래도 없으면 queue.Empty 발생
+        """
+        hands = self._get(timeout)
+        try:
+            yield hands
+        finally:
+            self._idle.put(hands)
+
+    def _get(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            reserved = self._created < self.size
+            if reserved:
+                self._created += 1
+        if not reserved:
+            return self._idle.get(timeout=timeout)
+        # 모델 로딩이 느리므로 락 밖에서 생성. 실패하면 자리를 돌려줘서 다음 요청이 다시 만들 수 있게 함
+        try:
+            return mp.solutions.hands.Hands(**self._options)
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize(),
+            "static_image_mode": self.static_image_mode
+        }
@@ -0,0 +1,165 @@
+import base64
+import binascii
+import datetime
+import hashlib
+import os
+import time
+
+import gridfs
+from gridfs.errors import FileExists, NoFile
+from pymongo.errors import DuplicateKeyError
+
+from services.database import get_db
+
+# 번역 이미지를 저장하는 GridFS 버킷 이름 (images.files, images.chunks 컬렉션)
+IMAGE_BUCKET = 'images'
+# 마지막으로 저장(재사용)된 뒤 이 시간(초)이 지나지 않은 이미지는 참조가 없어도 삭제하지 않음
+# save_image와 참조 문서 저장 사이에 삭제가 끼어들어 새 문서가 없는 이미지를 가리키는 것을 막음
+IMAGE_DELETE_GRACE_SECONDS = int(os.getenv('IMAGE_DELETE_GRACE_SECONDS', '300'))
+# 같은 이미지를 동시에 저장하거나 삭제 중인 이미지를 다시 저장할 때 재시도 횟수
+IMAGE_SAVE_RETRIES = 5
+# 목록 조회에서 이미지 필드를 읽어 오지 않고 이미지 유무만 계산하는 식 ($addFields)
+# 이미지 저장소의 image_id뿐 아니라 아직 이전하지 않은 문서 안의 Base64 이미지(image)도 이미지로 봄
+HAS_IMAGE = {'$or': [{'$eq': [{'$type': '$image_id'}, 'string']},
+                     {'$eq': [{'$type': '$image'}, 'string']}]}
+
+
+def decode_image(image):
+    """
+    data URL("data:image/jpeg;base64,...") 또는 Base64 문자열을 바이트와 MIME 타입으로 변환
+    :return: (바이트, MIME 타입)
+    """
+    content_type = 'image/jpeg'
+    if image.startswith('data:'):
+        header, image = image.split(',', 1)
+        content_type = header[5:].split(';')[0] or content_type
+    return base64.b64decode(image, validate=True), content_type
+
+
+def save_image(image):
+    """
+    이미지를 GridFS에 저장하고 ID를 반환
+    내용의 SHA-256 해시를 ID로 사용하므로 같은 이미지는 한 번만 저장됨
+    :param image: data URL 또는 Base64 문자열
+    :return: 이미지 ID, 이미지가 올바르지 않으면 None
+    """
+    try:
+        data, content_type = decode_image(image)
+    except (ValueError, binascii.Error):
+        return None
+
+    image_id = hashlib.sha256(data).hexdigest()
+    db = get_db()
+    files = db[f'{IMAGE_BUCKET}.files']
+    bucket = gridfs.GridFSBucket(db, bucket_name=IMAGE_BUCKET)
+    for _ in range(IMAGE_SAVE_RETRIES):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        # 이미 있으면 사용 시각만 갱신해서 delete_unreferenced_images가 유예 시간 동안 지우지 않게 함
+        if files.update_one({'_id': image_id}, {'$set': {'metadata.last_used': now}}).matched_count:
+            return image_id
+        try:
+            bucket.upload_from_stream_with_id(image_id, image_id, data,
+                                              metadata={'content_type': content_type, 'last_used': now})
+            return image_id
+        except (DuplicateKeyError, FileExists):
+            # 같은 이미지를 동시에 저장하는 중이거나 삭제 중인 이미지의 청크가 남아 있는 경우. 잠시 후 다시 확인
+            time.sleep(0.05)
+    raise RuntimeError(f"이미지 {image_id}를 저장하지 못했습니다.")
+
+
+def open_image(image_id):
+    """
+    저장된 이미지를 읽기 스트림(GridOut)으로 열어서 반환. 없으면 None
+    """
+    bucket = gridfs.GridFSBucket(get_db(), bucket_name=IMAGE_BUCKET)
+    try:
+        return bucket.open_download_stream(image_id)
+    except NoFile:
+        return None
+
+
+def delete_unreferenced_images(image_ids):
+    """
+    번역 결과나 저장된 수어에서 더 이상 참조하지 않는 이미지를 삭제
+    같은 이미지를 여러 문서가 공유할 수 있으므로 참조가 남아 있으면 지우지 않음
+    최근 IMAGE_DELETE_GRACE_SECONDS초 안에 save_image로 저장(재사용)된 이미지는 참조 문서가 아직 저장되지 않았을 수 있으므로 남겨 둠
+    """
+    image_ids = {image_id for image_id in image_ids if image_id}
+    if not image_ids:
+        return
+    db = get_db()
+    files = db[f'{IMAGE_BUCKET}.files']
+    chunks = db[f'{IMAGE_BUCKET}.chunks']
+    # 참조를 확인하기 전의 시각 기준. 이보다 먼저 사용된 이미지는 참조 문서가 이미 저장되어 있음
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=IMAGE_DELETE_GRACE_SECONDS)
+    referenced = set(db.translations.distinct('image_id', {'image_id': {'$in': list(image_ids)}}))
+    referenced |= set(db.saved_signs.distinct('image_id', {'image_id': {'$in': list(image_ids)}}))
+    unreferenced = list(image_ids - referenced)
+    if not unreferenced:
+        return
+
+    # 사용 시각이 없는 기존 이미지는 업로드 시각으로 판단
+    unused = {'_id': {'$in': unreferenced},
+              '$or': [{'metadata.last_used': {'$lt': cutoff}},
+                      {'metadata.last_used': {'$exists': False}, 'uploadDate': {'$lt': cutoff}}]}
+    candidates = {doc['_id']: doc['uploadDate'] for doc in files.find(unused, {'uploadDate': 1})}
+    if not candidates:
+        return
+    # 청크는 files_id가 아니라 지금 있는 청크의 _id로 지움. 삭제 직후 같은 이미지를 다시 올린 청크는 남김
+    candidate_chunks = list(chunks.find({'files_id': {'$in': list(candidates)}}, {'files_id': 1}))
+    # GridFSBucket.delete는 이미지마다 files/chunks 삭제를 따로 보내므로 컬렉션별로 한 번에 삭제
+    files.delete_many(unused)
+    # 그 사이에 다시 사용되어 지워지지 않은 이미지(업로드 시각이 그대로인 것)의 청크는 남김
+    kept = {doc['_id'] for doc in files.find({'_id': {'$in': list(candidates)}}, {'uploadDate': 1})
+            if doc['uploadDate'] == candidates[doc['_id']]}
+    chunk_ids = [chunk['_id'] for chunk in candidate_chunks if chunk['files_id'] not in kept]
+    if chunk_ids:
+        chunks.delete_many({'_id': {'$in': chunk_ids}})
+
+
+def migrate_inline_images():
+    """
+    문서 안에 Base64로 저장된 기존 이미지를 이미지 저장소로 옮기고 image_id로 교체
+    """
+    db = get_db()
+    for collection in [db.translations, db.saved_signs]:
+        migrated = 0
+        failed = 0
+        for doc in collection.find({'image': {'$type': 'string'}}, {'image': 1}):
+            image_id = save_image(doc['image'])
+            if image_id is None:
+                # 디코딩할 수 없는 이미지는 원본을 지우지 않고 그대로 둠
+                failed += 1
+                continue
+            collection.update_one({'_id': doc['_id']},
+                                  {'$set': {'image_id': image_id}, '$unset': {'image': ''}})
+            migrated += 1
+        print(f"{collection.name}: {migrated}개 문서 이미지 이전 완료, {failed}개 실패 (원본 유지)")
+
+
+def delete_orphan_images(batch_size=1000):
+    """
+    참조하는 문서가 없는 이미지를 모두 찾아서 삭제
+    유예 시간 안에 참조가 지워져서 delete_unreferenced_images가 남겨 둔 이미지를 정리할 때 사용
+    """
+    files = get_db()[f'{IMAGE_BUCKET}.files']
+    batch = []
+    for doc in files.find({}, {'_id': 1}):
+        batch.append(doc['_id'])
+        if len(batch) >= batch_size:
+            delete_unreferenced_images(batch)
+            batch = []
+    delete_unreferenced_images(batch)
+
+
+if __name__ == "__main__":
+    # backend 디렉토리에서 실행: python -m services.image_store [--cleanup]
+    import argparse
+    from dotenv import load_dotenv
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="문서 안의 기존 이미지를 이미지 저장소로 이전")
+    parser.add_argument("--cleanup", action="store_true", help="이전 후 참조하지 않는 이미지도 삭제")
+    args = parser.parse_args()
+    migrate_inline_images()
+    if args.cleanup:
+        delete_orphan_images()
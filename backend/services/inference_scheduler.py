@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+# 한 번에 묶어서 추론할 최대 요청 수
+INFERENCE_MAX_BATCH = int(os.getenv('INFERENCE_MAX_BATCH', '8'))
+# 첫 요청이 들어온 뒤 다른 요청을 기다리는 최대 시간(밀리초)
+INFERENCE_MAX_WAIT_MS = float(os.getenv('INFERENCE_MAX_WAIT_MS', '5'))
+# 요청 스레드가 추론 결과를 기다리는 최대 시간(초)
+INFERENCE_TIMEOUT = float(os.getenv('INFERENCE_TIMEOUT', '10'))
+
+
+class InferenceStats:
+    """
+    배치 크기와 큐 대기 시간 통계
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.batch_size_hist = {}
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.inference_total = 0.0
+
+    def record(self, batch_size, queue_waits, inference_time):
+        with self._lock:
+            self.batches += 1
+            self.items += batch_size
+            self.batch_size_hist[batch_size] = self.batch_size_hist.get(batch_size, 0) + 1
+            self.queue_wait_total += sum(queue_waits)
+            self.queue_wait_max = max(self.queue_wait_max, max(queue_waits))
+            self.inference_total += inference_time
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+                "batch_size_hist": {str(k): v for k, v in sorted(self.batch_size_hist.items())},
+                "avg_queue_wait_ms": self.queue_wait_total / self.items * 1000 if self.items else 0.0,
+                "max_queue_wait_ms": self.queue_wait_max * 1000,
+                "avg_inference_ms": self.inference_total / self.batches * 1000 if self.batches else 0.0
+            }
+
+
+class _Request:
+    def __init__(self, loaded, sequence):
+        self.loaded = loaded
+        self.sequence = sequence
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class InferenceScheduler:
+    """
+    여러 요청 스레드의 시퀀스를 모아서 한 번의 배치 추론으로 처리하는 전용 워커
+    첫 요청이 들어오면 max_wait_ms 동안 또는 max_batch_size개가 모일 때까지 기다린 뒤 추론하고,
+    결과를 각 요청의 Future로 돌려줌
+    """
+
+    def __init__(self, max_batch_size=INFERENCE_MAX_BATCH, max_wait_ms=INFERENCE_MAX_WAIT_MS,
+                 timeout=INFERENCE_TIMEOUT):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self.timeout = timeout
+        self.stats = InferenceStats()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        # 입력 형태별로 재사용하는 float32 배치 버퍼
+        self._batch_buffers = {}
+
+    def predict(self, loaded, sequence):
+        """
+        시퀀스 하나를 추론 큐에 넣고 결과를 기다림
+        :param loaded: 추론에 사용할 LoadedModel
+        :param sequence: (seq_len, *frame_shape) 배열
+        :return: 클래스별 확률 (num_classes,)
+        """
+        self._ensure_worker()
+        req = _Request(loaded, sequence)
+        self._queue.put(req)
+        return req.future.result(timeout=self.timeout)
+
+    def _ensure_worker(self):
+        # 워커 스레드는 fork 이후에도 동작하도록 첫 요청 시점에 시작
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="inference-worker", daemon=True)
+                self._worker.start()
+
+    def _collect(self):
+        # 첫 요청은 무한정 기다리고, 이후에는 마감 시간까지만 추가 요청을 모음
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            # 핫 리로드 직후에는 서로 다른 모델의 요청이 섞일 수 있으므로 모델별로 나눠서 추론
+            groups = {}
+            for req in batch:
+                groups.setdefault(id(req.loaded), []).append(req)
+            for reqs in groups.values():
+                self._infer(reqs)
+
+    def _infer(self, reqs):
+        start = time.perf_counter()
+        queue_waits = [start - req.enqueued_at for req in reqs]
+        try:
+            loaded = reqs[0].loaded
+            inputs = self._batch_buffer(loaded.input_shape[1:], len(reqs))
+            for i, req in enumerate(reqs):
+                inputs[i] = req.sequence
+            probabilities = loaded.predict(inputs)
+            for i, req in enumerate(reqs):
+                req.future.set_result(probabilities[i])
+        except Exception as e:
+            for req in reqs:
+                if not req.future.done():
+                    req.future.set_exception(e)
+        self.stats.record(len(reqs), queue_waits, time.perf_counter() - start)
+
+    def _batch_buffer(self, input_shape, size):
+        buffer = self._batch_buffers.get(input_shape)
+        if buffer is None:
+            buffer = np.empty((self.max_batch_size, *input_shape), dtype=np.float32)
+            self._batch_buffers = {input_shape: buffer}
+        return buffer[:size]
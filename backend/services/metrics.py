@@ -0,0 +1,39 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StageTimings:
+    """
+    처리 단계별(디코딩, MediaPipe, 추론 등) 소요 시간 통계
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, stage, seconds):
+        with self._lock:
+            stat = self._stats.setdefault(stage, [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+
+    @contextmanager
+    def measure(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                stage: {
+                    "count": count,
+                    "avg_ms": total / count * 1000 if count else 0.0,
+                    "max_ms": max_time * 1000
+                }
+                for stage, (count, total, max_time) in self._stats.items()
+            }
@@ -0,0 +1,248 @@
+import os
+import pickle
+import threading
+import time
+
+import numpy as np
+import tensorflow as tf
+
+# 모델 파일이 없을 때 사용하는 기본 단어 사전
+DEFAULT_WORD_DICT = {
+    "안녕하세요": 0,
+    "감사합니다": 1,
+    "반갑습니다": 2,
+    "도와주세요": 3,
+    "이해했습니다": 4
+}
+
+
+def build_inference_function(model, jit_compile=False):
+    """
+    모델을 입력 형태가 고정된 tf.function으로 감싸서 반환
+    배치 크기만 가변(None)이고 시퀀스 길이와 이미지 크기는 모델에서 읽어오므로 재트레이싱이 일어나지 않음
+    :param jit_compile: True면 XLA로 컴파일 (배치 크기가 바뀔 때마다 다시 컴파일됨)
+    """
+    input_spec = tf.TensorSpec(shape=(None, *model.input_shape[1:]), dtype=tf.float32)
+
+    @tf.function(input_signature=[input_spec], jit_compile=jit_compile)
+    def infer(inputs):
+        return model(inputs, training=False)
+
+    return infer
+
+
+class KerasRunner:
+    """
+    Keras 모델을 고정 시그니처 추론 함수로 실행
+    """
+    backend = "keras"
+
+    def __init__(self, model, jit_compile=False):
+        self.model = model
+        self.input_shape = tuple(model.input_shape)
+        self._infer = build_inference_function(model, jit_compile=jit_compile)
+
+    def predict(self, batch):
+        # model.predict는 데이터셋용 어댑터와 콜백을 매 호출마다 준비하므로 그래프 함수를 직접 호출
+        return self._infer(tf.convert_to_tensor(batch, dtype=tf.float32)).numpy()
+
+
+class TFLiteRunner:
+    """
+    export_tflite.py로 변환한 TFLite 모델을 인터프리터로 실행
+    인터프리터는 스레드 안전하지 않으므로 호출을 lock으로 직렬화
+    """
+    backend = "tflite"
+
+    def __init__(self, model_path, num_threads=None):
+        self.interpreter = tf.lite.Interpreter(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.input_shape = (None, *self._input['shape'][1:])
+        self._batch_size = int(self._input['shape'][0])
+        self._lock = threading.Lock()
+
+    def predict(self, batch):
+        batch = np.asarray(batch, dtype=self._input['dtype'])
+        with self._lock:
+            # 배치 크기가 바뀐 경우에만 텐서를 다시 할당
+            if batch.shape[0] != self._batch_size:
+                self.interpreter.resize_tensor_input(self._input['index'], batch.shape)
+                self.interpreter.allocate_tensors()
+                self._batch_size = batch.shape[0]
+            self.interpreter.set_tensor(self._input['index'], batch)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self._output['index']).copy()
+
+
+class LoadedModel:
+    """
+    한 번 로드된 모델과 단어 사전 묶음
+    핫 리로드 시에는 이 객체 전체를 교체하므로 요청 처리 중에 모델과 사전이 어긋나지 않음
+    """
+
+    def __init__(self, runner, word_dict, mtime):
+        self.runner = runner
+        self.word_dict = word_dict
+        # 예측 인덱스 -> 단어 변환용 역방향 사전을 미리 계산
+        self.idx_word_dict = {v: k for k, v in word_dict.items()}
+        self.mtime = mtime
+        self.loaded_at = time.time()
+        # 모델 입력 형태: (None, seq_len, *frame_shape)
+        # 이미지 모델은 frame_shape가 (ylen, xlen, 3), 랜드마크 모델은 (특징 수,)
+        self.input_shape = tuple(runner.input_shape)
+        self.seq_len = self.input_shape[1]
+        self.frame_shape = tuple(self.input_shape[2:])
+
+    def predict(self, batch):
+        """
+        배치 입력에 대한 클래스별 확률을 반환
+        :param batch: (batch, seq_len, *frame_shape) 배열
+        """
+        return self.runner.predict(batch)
+
+    @property
+    def version(self):
+        # 모델 파일의 수정 시각을 버전으로 사용
+        return f"{self.runner.backend}-{int(self.mtime)}"
+
+
+class ModelRegistry:
+    """
+    프로세스당 한 번만 모델과 단어 사전을 로드해서 공유하는 레지스트리
+    첫 사용 시 락을 잡고 지연 로드하며, reload()로 명시적인 핫 리로드를 지원
+    """
+
+    def __init__(self, model_path, word_dict_path, backend="keras", tflite_path=None, model_type="cnn_lstm",
+                 jit_compile=False, num_threads=None):
+        """
+        :param backend: 추론 방식 - keras: Keras 모델 / tflite: TFLite 인터프리터
+        :param tflite_path: backend가 tflite일 때 사용할 .tflite 파일 경로
+        :param model_type: 모델 종류 - cnn_lstm: 이미지 CNN+LSTM 모델 / landmark: 손 랜드마크 모델
+        :param jit_compile: keras 추론 함수를 XLA로 컴파일할지 여부
+        :param num_threads: TFLite 인터프리터 스레드 수 (None이면 기본값)
+        """
+        assert backend in ["keras", "tflite"], "backend should be keras|tflite"
+        assert model_type in ["cnn_lstm", "landmark"], "model_type should be cnn_lstm|landmark"
+        self.model_type = model_type
+        self.model_path = model_path
+        self.word_dict_path = word_dict_path
+        self.backend = backend
+        self.tflite_path = tflite_path
+        self.jit_compile = jit_compile
+        self.num_threads = num_threads
+        self._lock = threading.Lock()
+        self._loaded = None
+
+    def get(self):
+        """
+        로드된 모델을 반환. 아직 로드되지 않았다면 로드 후 반환
+        :return: LoadedModel 또는 로드 실패 시 None
+        """
+        loaded = self._loaded
+        if loaded is not None:
+            return loaded
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 로드했을 수 있음
+            if self._loaded is None:
+                self._loaded = self._load()
+            return self._loaded
+
+    def reload(self, force=False):
+        """
+        모델 파일이 변경되었으면 다시 로드해서 교체
+        :param force: True면 파일 변경 여부와 관계없이 다시 로드
+        :return: 리로드가 일어났는지 여부
+        """
+        with self._lock:
+            current = self._loaded
+            if not force and current is not None and os.path.exists(self.served_path):
+                if os.path.getmtime(self.served_path) <= current.mtime:
+                    return False
+            loaded = self._load()
+            if loaded is None:
+                # 새 모델 로드에 실패하면 기존 모델을 계속 사용
+                return False
+            self._loaded = loaded
+        self.warmup()
+        return True
+
+    def warmup(self):
+        """
+        더미 입력으로 한 번 추론해서 첫 실제 요청이 느려지지 않도록 함
+        """
+        loaded = self.get()
+        if loaded is None:
+            return False
+        dummy = np.zeros((1, *loaded.input_shape[1:]), dtype=np.float32)
+        start = time.perf_counter()
+        loaded.predict(dummy)
+        print(f"모델 워밍업 완료: {(time.perf_counter() - start) * 1000:.1f}ms")
+        return True
+
+    @property
+    def served_path(self):
+        # 실제로 서빙하는 모델 파일 (변경 감지 기준)
+        return self.tflite_path if self.backend == "tflite" else self.model_path
+
+    def status(self):
+        loaded = self._loaded
+        if loaded is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "model_type": self.model_type,
+            "backend": loaded.runner.backend,
+            "version": loaded.version,
+            "loaded_at": loaded.loaded_at,
+            "input_shape": list(loaded.input_shape[1:]),
+            "num_classes": len(loaded.word_dict)
+        }
+
+    def _load(self):
+        try:
+            if self.backend == "tflite":
+                runner = TFLiteRunner(self.tflite_path, num_threads=self.num_threads)
+            else:
+                runner = KerasRunner(self._load_keras_model(), jit_compile=self.jit_compile)
+
+            # 단어 사전 로드
+            if os.path.exists(self.word_dict_path):
+                with open(self.word_dict_path, 'rb') as f:
+                    word_dict = pickle.load(f)
+            else:
+                # 기본 단어 사전 생성 및 저장
+                word_dict = dict(DEFAULT_WORD_DICT)
+                with open(self.word_dict_path, 'wb') as f:
+                    pickle.dump(word_dict, f)
+                print(f"단어 사전이 {self.word_dict_path}에 저장되었습니다.")
+
+            mtime = os.path.getmtime(self.served_path)
+            print(f"모델 로드 완료: {self.served_path}")
+            return LoadedModel(runner, word_dict, mtime)
+        except Exception as e:
+            print(f"모델 로드 오류: {e}")
+            return None
+
+    def _load_keras_model(self):
+        # 모델 파일이 존재하는지 확인
+        if not os.path.exists(self.model_path):
+            print(f"모델 파일이 존재하지 않습니다. 새 모델을 생성합니다.")
+
+            # 모델 빌드 코드 import
+            if self.model_type == "landmark":
+                from models.landmark_model import build_landmark_model
+                model = build_landmark_model()
+            else:
+                from models.Sonmin_DNN_model import build_sign_language_model
+                model = build_sign_language_model()
+
+            # 모델 저장
+            os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+            model.save(self.model_path)
+            print(f"모델이 {self.model_path}에 저장되었습니다.")
+            return model
+
+        # 기존 모델 로드
+        return tf.keras.models.load_model(self.model_path)
@@ -0,0 +1,89 @@
+import os
+import threading
+
+import numpy as np
+
+# 손이 거의 움직이지 않은 프레임은 추론을 생략하고 이전 예측을 재사용
+MOTION_GATE = os.getenv('MOTION_GATE', 'True').lower() == 'true'
+# 랜드마크 평균 이동 거리 기준 (이미지 너비/높이 대비 비율). 이보다 적게 움직이면 추론 생략
+MOTION_GATE_THRESHOLD = float(os.getenv('MOTION_GATE_THRESHOLD', '0.01'))
+# 연속으로 추론을 생략할 수 있는 최대 프레임 수. 넘으면 움직임이 없어도 다시 추론
+MOTION_GATE_MAX_SKIP = int(os.getenv('MOTION_GATE_MAX_SKIP', '10'))
+
+
+def landmark_positions(results):
+    """
+    감지된 손 랜드마크의 이미지 좌표(x, y)를 (손 수 x 21, 2) 배열로 반환
+    """
+    return np.array([[lm.x, lm.y]
+                     for hand_landmarks in results.multi_hand_landmarks
+                     for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+class GateState:
+    """
+    세션별로 마지막으로 추론한 프레임의 랜드마크와 예측 결과
+    """
+
+    def __init__(self, positions, version, prediction):
+        self.positions = positions
+        self.version = version
+        self.prediction = prediction
+        self.skipped = 0
+
+
+class MotionGate:
+    """
+    세션별 랜드마크 변화량으로 추론 여부를 결정
+    마지막으로 추론한 프레임과 비교해서 손이 threshold보다 적게 움직였으면 이전 예측을 재사용
+    세션 상태는 FrameSession.gate에 저장하므로 호출하는 쪽에서 session.lock을 잡고 호출해야 함
+    """
+
+    def __init__(self, enabled=MOTION_GATE, threshold=MOTION_GATE_THRESHOLD, max_skip=MOTION_GATE_MAX_SKIP):
+        self.enabled = enabled
+        self.threshold = threshold
+        self.max_skip = max_skip
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.skipped = 0
+
+    def reuse(self, session, positions, version):
+        """
+        이전 예측을 재사용할 수 있으면 반환하고, 다시 추론해야 하면 None을 반환
+        """
+        state = session.gate
+        reusable = (
+            self.enabled
+            and state is not None
+            and state.version == version
+            and state.skipped < self.max_skip
+            and state.positions.shape == positions.shape
+            and np.linalg.norm(positions - state.positions, axis=1).mean() < self.threshold
+        )
+        with self._lock:
+            if reusable:
+                self.skipped += 1
+            else:
+                self.computed += 1
+        if not reusable:
+            return None
+        state.skipped += 1
+        return state.prediction
+
+    def remember(self, session, positions, version, prediction):
+        """
+        새로 추론한 결과를 세션에 저장
+        """
+        if self.enabled:
+            session.gate = GateState(positions, version, prediction)
+
+    def stats(self):
+        with self._lock:
+            total = self.computed + self.skipped
+            return {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "computed": self.computed,
+                "skipped": self.skipped,
+                "skip_rate": self.skipped / total if total else 0.0
+            }
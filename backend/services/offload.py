@@ -0,0 +1,75 @@
+import os
+import threading
+
+# CPU를 많이 쓰는 수어 인식(디코딩, MediaPipe, 추론)을 실행할 스레드 수
+INFERENCE_WORKERS = int(os.getenv('INFERENCE_WORKERS', str(os.cpu_count() or 4)))
+# 실행 중인 작업 외에 기다릴 수 있는 작업 수. 넘으면 바로 거절해서 요청이 끝없이 쌓이지 않게 함
+INFERENCE_QUEUE_LIMIT = int(os.getenv('INFERENCE_QUEUE_LIMIT', '64'))
+
+
+class ExecutorBusy(Exception):
+    """
+    실행 풀의 대기열이 가득 차서 작업을 받을 수 없음
+    """
+
+
+def gevent_active():
+    """
+    gevent 몽키 패치가 적용된 비동기 모드(SERVER_MODE=async)에서 실행 중인지 확인
+    """
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('socket')
+
+
+class BoundedExecutor:
+    """
+    크기가 제한된 작업 실행 풀
+    비동기 모드에서는 gevent의 네이티브 스레드 풀을 사용하므로 추론이 실행되는 동안에도
+    이벤트 루프는 다른 요청(MongoDB 조회 등)을 계속 처리함
+    """
+
+    def __init__(self, workers=INFERENCE_WORKERS, queue_limit=INFERENCE_QUEUE_LIMIT):
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        if gevent_active():
+            from gevent.threadpool import ThreadPoolExecutor
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def run(self, fn, *args, **kwargs):
+        """
+        fn을 실행 풀에서 실행하고 결과를 기다림. 대기열이 가득 차 있으면 ExecutorBusy 발생
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorBusy()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return self._executor.submit(fn, *args, **kwargs).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "gevent": gevent_active()
+            }
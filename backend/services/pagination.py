@@ -0,0 +1,94 @@
+import base64
+import datetime
+import json
+import os
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+
+# 목록 API의 기본 페이지 크기와 요청으로 지정할 수 있는 최대 페이지 크기
+PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', '20'))
+PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', '100'))
+
+
+def encode_cursor(sort_value, doc_id):
+    """
+    마지막 문서의 정렬 값과 _id를 클라이언트에 넘길 불투명한 커서 문자열로 변환
+    """
+    payload = json.dumps({"t": sort_value.isoformat(), "id": str(doc_id)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    커서 문자열을 (정렬 값, _id)로 변환. 형식이 올바르지 않으면 ValueError 발생
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except (ValueError, TypeError, KeyError, InvalidId) as e:
+        raise ValueError("cursor 형식이 올바르지 않습니다.") from e
+
+
+def parse_page_args(args):
+    """
+    요청의 limit, cursor 쿼리 파라미터를 읽음. 값이 올바르지 않으면 ValueError 발생
+    :return: (페이지 크기, (정렬 값, _id) 또는 None)
+    """
+    try:
+        limit = int(args.get('limit', PAGE_SIZE_DEFAULT))
+    except (TypeError, ValueError) as e:
+        raise ValueError("limit은 정수여야 합니다.") from e
+    if not 1 <= limit <= PAGE_SIZE_MAX:
+        raise ValueError(f"limit은 1~{PAGE_SIZE_MAX} 사이여야 합니다.")
+
+    cursor = args.get('cursor')
+    return limit, decode_cursor(cursor) if cursor else None
+
+
+def page_pipeline(query, sort_field, limit, after=None, projection=None, add_fields=None):
+    """
+    (sort_field, _id) 역순 키셋 페이지네이션 aggregate 파이프라인
+    $match, $sort, $limit이 맨 앞에 있으므로 find와 같이 인덱스를 사용하고, 그 뒤에 계산 필드를 추가하고 필드를 제외함
+    :param after: 이전 페이지의 마지막 (정렬 값, _id). None이면 첫 페이지
+    :param projection: 제외할 필드 ({'image': 0} 등). add_fields 계산 후에 적용
+    :param add_fields: 문서마다 계산해서 추가할 필드 ($addFields)
+    """
+    if after is not None:
+        sort_value, doc_id = after
+        query = {
+            **query,
+            '$or': [
+                {sort_field: {'$lt': sort_value}},
+                {sort_field: sort_value, '_id': {'$lt': doc_id}}
+            ]
+        }
+
+    # 다음 페이지가 있는지 알기 위해 하나 더 읽음
+    pipeline = [
+        {'$match': query},
+        {'$sort': {sort_field: -1, '_id': -1}},
+        {'$limit': limit + 1}
+    ]
+    if add_fields:
+        pipeline.append({'$addFields': add_fields})
+    if projection:
+        pipeline.append({'$project': projection})
+    return pipeline
+
+
+def find_page(collection, query, sort_field, limit, after=None, projection=None, add_fields=None):
+    """
+    (sort_field, _id) 역순 키셋 페이지네이션
+    skip 없이 마지막 문서 다음부터 인덱스를 따라 읽으므로 몇 번째 페이지든 조회 비용이 같음
+    :param after: 이전 페이지의 마지막 (정렬 값, _id). None이면 첫 페이지
+    :return: (문서 목록, 다음 페이지 커서 또는 None)
+    """
+    docs = list(collection.aggregate(page_pipeline(query, sort_field, limit, after, projection, add_fields)))
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1][sort_field], docs[-1]['_id'])
+    return docs, next_cursor
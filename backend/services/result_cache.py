@@ -0,0 +1,56 @@
+import os
+
+import cv2
+import numpy as np
+
+from services.ttl_cache import TTLCache
+
+# 같은(거의 같은) 프레임의 MediaPipe 손 감지 결과 캐시
+RESULT_CACHE = os.getenv('RESULT_CACHE', 'True').lower() == 'true'
+RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', '1024'))
+# 캐시 보관 시간(초)
+RESULT_CACHE_TTL = float(os.getenv('RESULT_CACHE_TTL', '30'))
+# 지각 해시 크기. hash_size x hash_size 비트 해시를 만들며, 클수록 비슷한 프레임을 더 엄격하게 구분
+RESULT_CACHE_HASH_SIZE = int(os.getenv('RESULT_CACHE_HASH_SIZE', '16'))
+
+# 해시를 계산하기 전 프레임을 줄이는 크기 (모델 입력 크기와 같은 67x120)
+HASH_FRAME_SIZE = (120, 67)
+
+
+def frame_hash(frame, hash_size=RESULT_CACHE_HASH_SIZE):
+    """
+    프레임의 차이 해시(dHash). 밝기 변화 방향만 비교하므로 JPEG 재압축이나 작은 노이즈에는 같은 값이 나옴
+    :param frame: BGR 이미지
+    :return: hash_size * hash_size 비트를 담은 bytes
+    """
+    small = cv2.resize(frame, HASH_FRAME_SIZE, interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    grid = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return np.packbits(grid[:, 1:] > grid[:, :-1]).tobytes()
+
+
+class ResultCache:
+    """
+    지각 해시를 키로 MediaPipe 손 감지 결과(results)를 캐시
+    예측은 세션의 프레임 시퀀스에 따라 달라지므로 캐시하지 않음. 손 감지 결과는 프레임 내용만으로 정해지므로
+    세션이나 사용자와 관계없이 재사용할 수 있고, 모델 버전과도 무관함
+    """
+
+    def __init__(self, enabled=RESULT_CACHE, maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL,
+                 hash_size=RESULT_CACHE_HASH_SIZE):
+        self.enabled = enabled
+        self.hash_size = hash_size
+        self._cache = TTLCache(maxsize, ttl)
+
+    def key(self, frame):
+        return frame_hash(frame, self.hash_size)
+
+    def get(self, key):
+        # 결과는 읽기만 하므로 복사하지 않고 여러 요청에서 공유
+        return self._cache.get(key)
+
+    def set(self, key, results):
+        self._cache.set(key, results)
+
+    def stats(self):
+        return {"enabled": self.enabled, **self._cache.stats()}
@@ -0,0 +1,57 @@
+"""
+추론용 TensorFlow 런타임 설정
+스레드 수와 GPU 메모리 설정은 TensorFlow가 첫 연산을 실행하기 전에만 바꿀 수 있으므로
+모델을 로드하기 전에 configure_tensorflow()를 호출해야 함
+
+- TF_NUM_INTRAOP_THREADS: 연산 하나(행렬 곱, 합성곱 등) 내부에서 사용하는 스레드 수 (0이면 CPU 코어 수)
+- TF_NUM_INTEROP_THREADS: 서로 독립적인 연산을 동시에 실행하는 스레드 수 (0이면 TensorFlow 기본값)
+- TF_ENABLE_ONEDNN_OPTS: oneDNN(CPU 최적화 커널) 사용 여부. TensorFlow를 import할 때 읽으므로 프로세스 시작 전에 설정
+- TF_XLA_JIT: 추론 함수를 XLA로 컴파일할지 여부
+- TF_GPU_MEMORY_GROWTH: GPU 메모리를 처음에 모두 잡지 않고 필요한 만큼 늘려가며 사용할지 여부
+"""
+import os
+
+import tensorflow as tf
+
+TF_NUM_INTRAOP_THREADS = int(os.getenv('TF_NUM_INTRAOP_THREADS', '0'))
+TF_NUM_INTEROP_THREADS = int(os.getenv('TF_NUM_INTEROP_THREADS', '0'))
+TF_XLA_JIT = os.getenv('TF_XLA_JIT', 'False').lower() == 'true'
+TF_GPU_MEMORY_GROWTH = os.getenv('TF_GPU_MEMORY_GROWTH', 'True').lower() == 'true'
+
+_configured = False
+
+
+def configure_tensorflow(intra_op_threads=TF_NUM_INTRAOP_THREADS, inter_op_threads=TF_NUM_INTEROP_THREADS,
+                         memory_growth=TF_GPU_MEMORY_GROWTH):
+    """
+    스레드 수와 GPU 메모리 설정을 적용. 프로세스에서 한 번만 적용되고 이후 호출은 무시됨
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    try:
+        if intra_op_threads > 0:
+            tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        if inter_op_threads > 0:
+            tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+        if memory_growth:
+            for gpu in tf.config.list_physical_devices('GPU'):
+                tf.config.experimental.set_memory_growth(gpu, True)
+    except RuntimeError as e:
+        # 이미 TensorFlow 런타임이 초기화된 경우
+        print(f"TensorFlow 런타임 설정 오류: {e}")
+
+
+def status():
+    """
+    현재 적용된 런타임 설정
+    """
+    return {
+        "intra_op_threads": tf.config.threading.get_intra_op_parallelism_threads(),
+        "inter_op_threads": tf.config.threading.get_inter_op_parallelism_threads(),
+        "onednn": os.getenv('TF_ENABLE_ONEDNN_OPTS', 'default'),
+        "xla_jit": TF_XLA_JIT,
+        "gpu_memory_growth": TF_GPU_MEMORY_GROWTH,
+        "gpus": len(tf.config.list_physical_devices('GPU'))
+    }
@@ -0,0 +1,44 @@
+"""
+블루프린트의 주요 조회 쿼리가 인덱스를 사용하는지 explain()으로 확인
+서버와 같은 환경 변수(MONGO_HOST 등)의 MongoDB에 접속할 수 없으면 건너뜀
+인덱스는 별도의 테스트 데이터베이스에 만들고 테스트가 끝나면 지움
+"""
+import os
+import sys
+
+import pytest
+
+pymongo = pytest.importorskip('pymongo')
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from services import database
+
+TEST_DB_NAME = 'sueorang_index_test'
+
+
+@pytest.fixture(scope='module')
+def index_db():
+    client = pymongo.MongoClient(database.build_mongo_uri(), serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command('ping')
+    except pymongo.errors.PyMongoError as e:
+        client.close()
+        pytest.skip(f"MongoDB에 접속할 수 없음: {e}")
+
+    original = database.MONGO_DB_NAME
+    database.MONGO_DB_NAME = TEST_DB_NAME
+    try:
+        database.ensure_indexes()
+        yield database.get_db()
+    finally:
+        database.MONGO_DB_NAME = original
+        client.drop_database(TEST_DB_NAME)
+        client.close()
+
+
+def test_queries_use_indexes(index_db):
+    stages = database.explain_queries()
+    failed = {name: query_stages for name, query_stages in stages.items() if not database.uses_index(query_stages)}
+    assert not failed, f"인덱스를 사용하지 않는 쿼리: {failed}"
@@ -12,6 +12,8 @@ export const API_URL = __DEV__ ? DEV_API_URL : PROD_API_URL;
 // API 엔드포인트
 export const API_ENDPOINTS = {
   translate: '/api/translate',
+  // 바이너리 JPEG 프레임 스트리밍 (WebSocket)
+  translateStream: '/ws/translate',
   health: '/api/health',
 };
 
@@ -23,6 +23,8 @@ const CameraScreen = ({ navigation }) => {
   const [cameraPosition, setCameraPosition] = useState('front');
   
   const cameraRef = useRef(null);
+  // 서버가 발급한 세션 ID. 다음 요청부터 함께 보내서 서버가 같은 프레임 시퀀스를 이어서 사용하도록 함
+  const sessionIdRef = useRef(null);
   const isFocused = useIsFocused();
   const devices = useCameraDevices();
   const device = cameraPosition === 'back' ? devices.back : devices.front;
@@ -113,7 +115,11 @@ const CameraScreen = ({ navigation }) => {
         // 예시 요청 (실제 구현에서는 수정 필요)
         const response = await axios.post(`${API_URL}/api/translate`, {
           frame: frames[0], // 첫 번째 프레임만 전송 (예시)
+          ...(sessionIdRef.current ? { session_id: sessionIdRef.current } : {}),
         });
+        if (response.data && response.data.session_id) {
+          sessionIdRef.current = response.data.session_id;
+        }
         
         if (response.data && response.data.predicted_word) {
           // 결과 화면으로 이동